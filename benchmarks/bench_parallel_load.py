@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Масштабирование параллельной загрузки XML по числу процессов.
+
+Запуск: python benchmarks/bench_parallel_load.py [число_работников]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "examples"))
+from examples2 import Staff, Worker  # noqa: E402
+
+
+def measure(func, repeat: int = 3) -> float:
+    """Минимальное время выполнения функции в секундах"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    cpu_count = os.cpu_count() or 1
+
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, "staff.xml")
+        Staff(
+            workers=[
+                Worker(f"Работник {i:07d}", f"Должность {i % 50}", 1970 + i % 50)
+                for i in range(count)
+            ]
+        ).save(filename)
+
+        print(f"Файл: {os.path.getsize(filename) / 1024:.1f} КиБ, {count} работников")
+        baseline = measure(lambda: Staff().load(filename))
+        print(f"  load{'':<18} {baseline * 1000:>10.1f} мс")
+
+        max_workers = 1
+        while max_workers <= cpu_count:
+            seconds = measure(
+                lambda: Staff().load_parallel(filename, max_workers=max_workers)
+            )
+            print(
+                f"  load_parallel({max_workers:>2}){'':<5} {seconds * 1000:>10.1f} мс"
+                f"  x{baseline / seconds:.2f}"
+            )
+            max_workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Сравнение загрузки XML и бинарного снимка по времени и размеру файла.
+
+Запуск: python benchmarks/bench_snapshot.py [число_записей]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "examples"))
+from examples2 import Staff, Worker  # noqa: E402
+from task_package.zad1 import MusicCatalog, Track  # noqa: E402
+
+
+def measure(func, repeat: int = 3) -> float:
+    """Минимальное время выполнения функции в секундах"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def report(title: str, path: str, seconds: float) -> None:
+    size = os.path.getsize(path)
+    print(f"  {title:<22} {seconds * 1000:>10.1f} мс {size / 1024:>12.1f} КиБ")
+
+
+def bench_staff(count: int, directory: str) -> None:
+    print(f"Staff, {count} работников:")
+    staff = Staff(
+        workers=[
+            Worker(f"Работник {i:07d}", f"Должность {i % 50}", 1970 + i % 50)
+            for i in range(count)
+        ]
+    )
+    xml_path = os.path.join(directory, "staff.xml")
+    bin_path = os.path.join(directory, "staff.bin")
+    staff.save(xml_path)
+    staff.save_snapshot(bin_path)
+
+    report("load (XML)", xml_path, measure(lambda: Staff().load(xml_path)))
+    report(
+        "load_snapshot", bin_path, measure(lambda: Staff().load_snapshot(bin_path))
+    )
+
+    def open_only() -> None:
+        with Staff.open_snapshot(bin_path) as snapshot:
+            snapshot[len(snapshot) // 2]
+
+    report("open_snapshot + 1 rec", bin_path, measure(open_only))
+
+
+def bench_catalog(count: int, directory: str) -> None:
+    print(f"MusicCatalog, {count} треков:")
+    catalog = MusicCatalog(
+        tracks=[
+            Track(f"Трек {i}", f"Исполнитель {i % 1000}", 60 + i % 600)
+            for i in range(count)
+        ]
+    )
+    bin_path = os.path.join(directory, "catalog.bin")
+    catalog.save_snapshot(bin_path)
+
+    report(
+        "load_snapshot",
+        bin_path,
+        measure(lambda: MusicCatalog.load_snapshot(bin_path)),
+    )
+
+    def open_only() -> None:
+        with MusicCatalog.open_snapshot(bin_path) as snapshot:
+            snapshot[len(snapshot) // 2]
+
+    report("open_snapshot + 1 rec", bin_path, measure(open_only))
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    with tempfile.TemporaryDirectory() as directory:
+        bench_staff(count, directory)
+        bench_catalog(count, directory)
+
+
+if __name__ == "__main__":
+    main()
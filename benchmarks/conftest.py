@@ -0,0 +1,229 @@
+"""Инфраструктура для тестов производительности.
+
+Запуск: python -m pytest benchmarks [--bench-max-size N] [--bench-save]
+    [--bench-enforce]
+
+Для каждого теста измеряется лучшее время из нескольких запусков и пиковое
+потребление памяти (tracemalloc). Рядом с каждым тестом замеряется эталонный
+цикл, и с базовыми значениями из benchmarks/baselines.json сравнивается
+отношение времени теста к времени эталона: так результат не зависит от
+скорости машины и её загрузки в момент запуска. Если отношение выросло больше
+чем в --bench-threshold раз, выдаётся предупреждение; тест падает только с
+--bench-enforce, поскольку на общей машине шум измерений сопоставим с порогом.
+Тест без базового значения тоже выдаёт предупреждение, а с
+--bench-require-baseline падает. --bench-save записывает
+текущие результаты как новую базу.
+"""
+
+import json
+import os
+import sys
+import time
+import tracemalloc
+import warnings
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "examples"))
+
+SIZES = [10**3, 10**4, 10**5, 10**6, 10**7]
+DEFAULT_BASELINES = os.path.join(os.path.dirname(__file__), "baselines.json")
+# Минимальное суммарное время измерения и предельное число запусков
+MIN_DURATION = 0.2
+MAX_REPEAT = 1000
+# Число итераций эталонного цикла и минимальное суммарное время его замера
+CALIBRATION_LOOPS = 20_000
+CALIBRATION_DURATION = 0.05
+
+
+@dataclass
+class Measurement:
+    seconds: float
+    peak_bytes: int
+    # Время эталонного цикла, замеренное перед тестом
+    calibration: float
+
+    @property
+    def relative(self) -> float:
+        """Время теста в единицах эталонного цикла"""
+        return self.seconds / self.calibration
+
+
+def calibrate() -> float:
+    """Лучшее время эталонного цикла на чистом Python"""
+    best = float("inf")
+    started = time.perf_counter()
+    while time.perf_counter() - started < CALIBRATION_DURATION:
+        start = time.perf_counter()
+        total = 0
+        for i in range(CALIBRATION_LOOPS):
+            total += i * i
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def relative_to(baseline: Dict[str, float]) -> Optional[float]:
+    """Относительное время базового значения; None для базы без эталона"""
+    calibration = baseline.get("calibration")
+    return baseline["seconds"] / calibration if calibration else None
+
+
+class Benchmark:
+    """Измеритель времени и памяти для одного теста"""
+
+    def __init__(self, name: str, config: pytest.Config) -> None:
+        self.name = name
+        self.config = config
+        self.measurement: Optional[Measurement] = None
+
+    def __call__(self, func: Callable[..., Any], *args: Any, repeat: int = 5) -> Any:
+        """Измерение функции: лучшее время из repeat запусков и пик памяти.
+
+        Короткие функции запускаются, пока суммарное время не достигнет
+        MIN_DURATION: лучшее из многих запусков меньше зависит от шума.
+        """
+        calibration = calibrate()
+        best = float("inf")
+        result = None
+        runs = 0
+        started = time.perf_counter()
+        while runs < repeat or (
+            time.perf_counter() - started < MIN_DURATION and runs < MAX_REPEAT
+        ):
+            start = time.perf_counter()
+            result = func(*args)
+            best = min(best, time.perf_counter() - start)
+            runs += 1
+
+        tracemalloc.start()
+        try:
+            func(*args)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        self.measurement = Measurement(best, peak, calibration)
+        self._check_regression()
+        return result
+
+    def _check_regression(self) -> None:
+        """Сравнение с базовым значением"""
+        assert self.measurement is not None
+        baseline = self.config.bench_baselines.get(self.name)  # type: ignore
+        threshold = self.config.getoption("--bench-threshold")
+        if self.config.getoption("--bench-save"):
+            return
+        expected = None if baseline is None else relative_to(baseline)
+        if expected is None:
+            message = f"{self.name}: no baseline, run with --bench-save to record one"
+            if self.config.getoption("--bench-require-baseline"):
+                pytest.fail(message)
+            warnings.warn(message, pytest.PytestWarning)
+            return
+        ratio = self.measurement.relative / expected
+        if ratio > threshold:
+            message = (
+                f"{self.name}: {self.measurement.seconds * 1000:.2f} ms, "
+                f"x{ratio:.2f} of the baseline relative to the calibration loop "
+                f"(threshold x{threshold})"
+            )
+            if self.config.getoption("--bench-enforce"):
+                pytest.fail(message)
+            warnings.warn(message, pytest.PytestWarning)
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("bench", "тесты производительности")
+    group.addoption(
+        "--bench-max-size",
+        type=int,
+        default=10**5,
+        help="максимальный размер данных (до 10**7)",
+    )
+    group.addoption(
+        "--bench-threshold",
+        type=float,
+        default=1.5,
+        help="допустимое замедление относительно базы",
+    )
+    group.addoption(
+        "--bench-save",
+        action="store_true",
+        help="сохранить результаты как новую базу",
+    )
+    group.addoption(
+        "--bench-enforce",
+        action="store_true",
+        help="считать ошибкой замедление больше --bench-threshold",
+    )
+    group.addoption(
+        "--bench-require-baseline",
+        action="store_true",
+        help="считать ошибкой отсутствие базового значения",
+    )
+    group.addoption(
+        "--startup-budget-ms",
+        type=float,
+        default=150.0,
+        help="допустимое время импорта при запуске",
+    )
+    group.addoption(
+        "--bench-baselines",
+        default=DEFAULT_BASELINES,
+        help="файл с базовыми значениями",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    path = config.getoption("--bench-baselines")
+    baselines: Dict[str, Dict[str, float]] = {}
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf8") as fin:
+            baselines = json.load(fin)
+    config.bench_baselines = baselines  # type: ignore
+    config.bench_results = {}  # type: ignore
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    if "size" in metafunc.fixturenames:
+        max_size = metafunc.config.getoption("--bench-max-size")
+        metafunc.parametrize("size", [size for size in SIZES if size <= max_size])
+
+
+@pytest.fixture
+def bench(request: pytest.FixtureRequest) -> Any:
+    benchmark = Benchmark(request.node.nodeid, request.config)
+    yield benchmark
+    if benchmark.measurement is not None:
+        results = request.config.bench_results  # type: ignore[attr-defined]
+        results[benchmark.name] = benchmark.measurement
+
+
+def pytest_terminal_summary(terminalreporter: Any, config: pytest.Config) -> None:
+    results: Dict[str, Measurement] = getattr(config, "bench_results", {})
+    if not results:
+        return
+
+    terminalreporter.section("benchmarks")
+    width = max(len(name) for name in results)
+    lines: List[str] = []
+    for name, measurement in sorted(results.items()):
+        baseline = config.bench_baselines.get(name)  # type: ignore
+        expected = relative_to(baseline) if baseline else None
+        ratio = f"x{measurement.relative / expected:.2f}" if expected else "new"
+        lines.append(
+            f"{name:<{width}} {measurement.seconds * 1000:>10.3f} ms "
+            f"{measurement.peak_bytes / 1024:>10.1f} KiB {ratio:>6}"
+        )
+    terminalreporter.write_line("\n".join(lines))
+
+    if config.getoption("--bench-save"):
+        path = config.getoption("--bench-baselines")
+        baselines = dict(config.bench_baselines)  # type: ignore
+        baselines.update({name: asdict(m) for name, m in results.items()})
+        with open(path, "w", encoding="utf8") as fout:
+            json.dump(baselines, fout, indent=2, sort_keys=True)
+        terminalreporter.write_line(f"baselines saved to {path}")
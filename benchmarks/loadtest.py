@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Генерация синтетических данных и нагрузочное тестирование.
+
+Примеры:
+    python benchmarks/loadtest.py generate tracks -n 1000000 -o tracks.bin
+    python benchmarks/loadtest.py generate staff -n 100000 -o staff.xml
+    python benchmarks/loadtest.py generate positions -n 10000 -o points.csv
+    python benchmarks/loadtest.py run tracks tracks.bin --queries 1000
+    python benchmarks/loadtest.py run positions points.csv --queries 1000
+"""
+
+import argparse
+import csv
+import os
+import random
+import sys
+import time
+from typing import Callable, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "examples"))
+from examples1 import Position  # noqa: E402
+from examples2 import Staff  # noqa: E402
+from task_package.synthetic import (  # noqa: E402
+    generate_positions,
+    generate_tracks,
+    generate_workers,
+    percentiles,
+    write_workers_xml,
+    zipf_weights,
+)
+from task_package.zad1 import MusicCatalog  # noqa: E402
+
+Query = Callable[[], object]
+
+
+def generate(args: argparse.Namespace) -> None:
+    if args.kind == "tracks":
+        catalog = MusicCatalog(tracks=list(generate_tracks(args.count, args.seed)))
+        catalog.save_snapshot(args.output)
+    elif args.kind == "staff":
+        write_workers_xml(args.output, generate_workers(args.count, args.seed))
+    else:
+        with open(args.output, "w", encoding="utf8", newline="") as fout:
+            writer = csv.writer(fout)
+            writer.writerow(["name", "lon", "lat"])
+            writer.writerows(generate_positions(args.count, args.seed))
+    print(f"{args.output}: {os.path.getsize(args.output) / 1024:.1f} КиБ")
+
+
+def tracks_workload(filename: str, rng: random.Random) -> Callable[[], Query]:
+    catalog = MusicCatalog.load_snapshot(filename)
+    # Ранг исполнителя - место по числу треков, как при генерации по Ципфу
+    ranked = sorted(catalog.all_artist_stats(), key=lambda stats: -stats.count)
+    artists = [stats.artist for stats in ranked]
+    cum_weights = zipf_weights(len(artists))
+
+    def next_query() -> Query:
+        if rng.random() < 0.7:
+            (artist,) = rng.choices(artists, cum_weights=cum_weights)
+            return lambda: catalog.get_tracks_by_artist(artist)
+        minutes = rng.randint(1, 10)
+        return lambda: catalog.get_tracks_shorter_than(minutes)
+
+    return next_query
+
+
+def staff_workload(filename: str, rng: random.Random) -> Callable[[], Query]:
+    staff = Staff()
+    staff.load(filename)
+    names = [worker.name for worker in staff.workers]
+    counter = iter(range(sys.maxsize))
+
+    def next_query() -> Query:
+        choice = rng.random()
+        if choice < 0.5:
+            name = rng.choice(names)
+            return lambda: staff.get(name)
+        if choice < 0.8:
+            period = rng.randint(0, 50)
+            return lambda: staff.select(period)
+        if choice < 0.9:
+            name = f"Новый Н.Н. #{next(counter)}"
+            return lambda: staff.add(name, "Стажёр", 2025)
+        name = rng.choice(names)
+        return lambda: staff.upsert(name, "Инженер", 2000)
+
+    return next_query
+
+
+def positions_workload(filename: str, rng: random.Random) -> Callable[[], Query]:
+    with open(filename, "r", encoding="utf8", newline="") as fin:
+        reader = csv.DictReader(fin)
+        points = [
+            Position(row["name"], float(row["lon"]), float(row["lat"]))
+            for row in reader
+        ]
+
+    def nearest(origin: Position, candidates: List[Position]) -> Position:
+        return min(candidates, key=origin.distance_to)
+
+    def next_query() -> Query:
+        origin = rng.choice(points)
+        if rng.random() < 0.8:
+            other = rng.choice(points)
+            return lambda: origin.distance_to(other)
+        candidates = rng.sample(points, min(100, len(points)))
+        return lambda: nearest(origin, candidates)
+
+    return next_query
+
+
+WORKLOADS = {
+    "tracks": tracks_workload,
+    "staff": staff_workload,
+    "positions": positions_workload,
+}
+
+
+def run(args: argparse.Namespace) -> None:
+    rng = random.Random(args.seed)
+    next_query = WORKLOADS[args.kind](args.input, rng)
+
+    latencies = []
+    started = time.perf_counter()
+    for _ in range(args.queries):
+        query = next_query()
+        start = time.perf_counter()
+        query()
+        latencies.append(time.perf_counter() - start)
+    elapsed = time.perf_counter() - started
+
+    busy = sum(latencies)
+    print(f"Запросов: {args.queries}, время: {elapsed:.3f} с")
+    print(f"Пропускная способность: {args.queries / busy:.1f} запросов/с")
+    for point, value in percentiles(latencies, (50, 90, 99, 100)):
+        print(f"  p{point:<3g} {value * 1000:>10.3f} мс")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    generate_parser = subparsers.add_parser("generate", help="создать набор данных")
+    generate_parser.add_argument("kind", choices=sorted(WORKLOADS))
+    generate_parser.add_argument("-n", "--count", type=int, default=10_000)
+    generate_parser.add_argument("-s", "--seed", type=int, default=0)
+    generate_parser.add_argument("-o", "--output", required=True)
+    generate_parser.set_defaults(func=generate)
+
+    run_parser = subparsers.add_parser("run", help="выполнить смешанную нагрузку")
+    run_parser.add_argument("kind", choices=sorted(WORKLOADS))
+    run_parser.add_argument("input")
+    run_parser.add_argument("-q", "--queries", type=int, default=1000)
+    run_parser.add_argument("-s", "--seed", type=int, default=0)
+    run_parser.set_defaults(func=run)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
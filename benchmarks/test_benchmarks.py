@@ -0,0 +1,73 @@
+import random
+
+import pytest
+from examples1 import CHORD2, EQUIRECTANGULAR, HAVERSINE, Position
+from examples2 import Staff, Worker
+from task_package.zad1 import MusicCatalog, Track
+from task_package.zad2 import RingBuffer
+
+
+class TestRingBufferBenchmarks:
+    """Производительность кольцевого буфера"""
+
+    def test_push(self, bench, size: int) -> None:
+        """Добавление size элементов с переполнением буфера"""
+
+        def push_all() -> None:
+            buffer: RingBuffer[int] = RingBuffer[int](capacity=1000)
+            for i in range(size):
+                buffer.push(i)
+
+        bench(push_all)
+
+
+class TestMusicCatalogBenchmarks:
+    """Производительность каталога музыки"""
+
+    @pytest.fixture
+    def catalog(self, size: int) -> MusicCatalog:
+        return MusicCatalog(
+            tracks=[
+                Track(f"Трек {i}", f"Исполнитель {i % 100}", 60 + i % 600)
+                for i in range(size)
+            ]
+        )
+
+    def test_get_tracks_by_artist(self, bench, catalog: MusicCatalog) -> None:
+        """Поиск треков исполнителя полным проходом"""
+        result = bench(catalog.get_tracks_by_artist, "исполнитель 7")
+        assert len(result) == len(catalog.tracks) // 100
+
+
+class TestPositionBenchmarks:
+    """Производительность расчёта расстояний"""
+
+    @pytest.mark.parametrize("mode", [HAVERSINE, EQUIRECTANGULAR, CHORD2])
+    def test_distance_to(self, bench, size: int, mode: str) -> None:
+        """size расчётов расстояния между случайными точками"""
+        rng = random.Random(size)
+        points = [
+            Position(str(i), rng.uniform(-180, 180), rng.uniform(-90, 90))
+            for i in range(size)
+        ]
+
+        def distances() -> float:
+            return sum(a.distance_to(b, mode) for a, b in zip(points, points[1:]))
+
+        bench(distances)
+
+
+class TestStaffBenchmarks:
+    """Производительность загрузки штата"""
+
+    def test_load(self, bench, size: int, tmp_path) -> None:
+        """Загрузка XML-файла с size работниками"""
+        filename = str(tmp_path / "staff.xml")
+        Staff(
+            workers=[
+                Worker(f"Работник {i:08d}", f"Должность {i % 50}", 1970 + i % 50)
+                for i in range(size)
+            ]
+        ).save(filename)
+
+        bench(Staff().load, filename, repeat=3)
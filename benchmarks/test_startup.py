@@ -0,0 +1,77 @@
+import os
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+import pytest
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+HEAVY_MODULES = {
+    "xml.etree.ElementTree",
+    "xml.sax.saxutils",
+    "sqlite3",
+    "mmap",
+    "concurrent.futures",
+    "multiprocessing",
+}
+
+
+def import_profile(args: List[str], stdin: str = "") -> Dict[str, int]:
+    """Модули верхнего уровня, загруженные при запуске, и их время в мкс"""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [os.path.join(ROOT, "src"), os.path.join(ROOT, "examples")]
+    )
+    env.pop("TASK_PACKAGE_INSTRUMENT", None)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        input=stdin,
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+
+    modules: Dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, raw_name = line.split("|")
+        name = raw_name.strip()
+        # Отступ отражает вложенность: учитываем время только верхнего уровня,
+        # а имена - всех загруженных модулей
+        top_level = len(raw_name) - len(raw_name.lstrip()) <= 1
+        modules[name] = int(cumulative) if top_level else 0
+    return modules
+
+
+def startup_cost(args: List[str], stdin: str = "") -> Tuple[float, Dict[str, int]]:
+    """Лучшее за три запуска время импорта сверх пустого интерпретатора, мс"""
+    baseline = import_profile(["-c", "pass"])
+    best = float("inf")
+    modules: Dict[str, int] = {}
+    for _ in range(3):
+        modules = import_profile(args, stdin)
+        extra = sum(us for name, us in modules.items() if name not in baseline)
+        best = min(best, extra / 1000)
+    return best, modules
+
+
+@pytest.mark.parametrize(
+    "args,stdin",
+    [
+        (["-c", "import task_package"], ""),
+        (["-c", "import task_package.zad1, task_package.zad2"], ""),
+        (["-c", "import task_package.synthetic"], ""),
+        (["-c", "import examples1, examples2"], ""),
+        ([os.path.join(ROOT, "examples", "examples2.py"), "--batch"], "help\nlist\n"),
+    ],
+    ids=["package", "modules", "synthetic", "examples", "staff-cli"],
+)
+def test_startup_budget(args: List[str], stdin: str, request) -> None:
+    """Запуск не загружает тяжёлые модули и укладывается в бюджет времени"""
+    budget = request.config.getoption("--startup-budget-ms")
+    cost, modules = startup_cost(args, stdin)
+
+    assert HEAVY_MODULES.isdisjoint(modules), HEAVY_MODULES & set(modules)
+    assert cost <= budget, f"import cost {cost:.1f} ms > budget {budget} ms"
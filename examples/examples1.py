@@ -1,5 +1,34 @@
-from dataclasses import dataclass
-from math import asin, cos, radians, sin, sqrt
+from dataclasses import dataclass, field
+from math import asin, cos, pi, radians, sin, sqrt
+
+EARTH_RADIUS = 6371  # Earth radius in kilometers
+
+# Distance modes, from exact to fastest:
+#   HAVERSINE       - exact great-circle distance in km.
+#   EQUIRECTANGULAR - flat projection around the mean latitude, in km. Relative
+#                     error stays below 0.01% up to 100 km and below 1% up to
+#                     1000 km at latitudes under 70 degrees; it grows near the
+#                     poles and for continental distances, so use it for coarse
+#                     radius filters only.
+#   CHORD2          - squared chord between unit vectors (no units). It is a
+#                     monotonic function of the exact distance, so rankings and
+#                     radius checks against km_to_chord2(radius) are exact.
+_DEGREE = pi / 180
+_HALF_DEGREE = pi / 360
+_KM_PER_DEGREE = EARTH_RADIUS * pi / 180
+
+HAVERSINE = "haversine"
+EQUIRECTANGULAR = "equirectangular"
+CHORD2 = "chord2"
+
+
+def km_to_chord2(distance):
+    distance = min(distance, pi * EARTH_RADIUS)
+    return (2 * sin(distance / (2 * EARTH_RADIUS))) ** 2
+
+
+def chord2_to_km(chord2):
+    return 2 * EARTH_RADIUS * asin(min(1.0, sqrt(chord2) / 2))
 
 
 @dataclass
@@ -7,9 +36,18 @@ class Position:
     name: str
     lon: float = 0.0
     lat: float = 0.0
+    # (lon, lat, x, y, z) of the last computed unit vector
+    _unit: tuple | None = field(default=None, init=False, repr=False, compare=False)
+
+    def distance_to(self, other, mode=HAVERSINE):
+        if mode != HAVERSINE:
+            if mode == EQUIRECTANGULAR:
+                return self.equirectangular_to(other)
+            if mode == CHORD2:
+                return self.chord2_to(other)
+            raise ValueError(f"Unknown distance mode: {mode}")
 
-    def distance_to(self, other):
-        r = 6371  # Earth radius in kilometers
+        r = EARTH_RADIUS
         lam_1, lam_2 = radians(self.lon), radians(other.lon)
         phi_1, phi_2 = radians(self.lat), radians(other.lat)
         h = (
@@ -17,3 +55,184 @@ class Position:
             + cos(phi_1) * cos(phi_2) * sin((lam_2 - lam_1) / 2) ** 2
         )
         return 2 * r * asin(sqrt(h))
+
+    def equirectangular_to(self, other):
+        d_lon = (other.lon - self.lon + 180) % 360 - 180
+        x = d_lon * cos((self.lat + other.lat) * _HALF_DEGREE)
+        y = other.lat - self.lat
+        return _KM_PER_DEGREE * sqrt(x * x + y * y)
+
+    def _update_unit(self):
+        lam, phi = self.lon * _DEGREE, self.lat * _DEGREE
+        cos_phi = cos(phi)
+        self._unit = (
+            self.lon,
+            self.lat,
+            cos_phi * cos(lam),
+            cos_phi * sin(lam),
+            sin(phi),
+        )
+        return self._unit
+
+    def unit_vector(self):
+        unit = self._unit
+        if unit is None or unit[0] != self.lon or unit[1] != self.lat:
+            unit = self._update_unit()
+        return unit[2:]
+
+    def chord2_to(self, other):
+        # The unit vector checks are inlined: this is the hot path of prefilters
+        a = self._unit
+        if a is None or a[0] != self.lon or a[1] != self.lat:
+            a = self._update_unit()
+        b = other._unit
+        if b is None or b[0] != other.lon or b[1] != other.lat:
+            b = other._update_unit()
+        dx, dy, dz = a[2] - b[2], a[3] - b[3], a[4] - b[4]
+        return dx * dx + dy * dy + dz * dz
+
+
+def within_radius(origin, candidates, radius):
+    # Exact radius filter that needs no trigonometry per candidate
+    limit = km_to_chord2(radius)
+    return [point for point in candidates if origin.chord2_to(point) <= limit]
+
+
+@dataclass
+class Route:
+    stops: list[Position] = field(default_factory=list)
+    # Memoized pairwise distances keyed by coordinates, so reordering the same
+    # stops never recomputes a pair
+    _matrix: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+    # _cumulative[i] is the route length from stops[0] to stops[i]
+    _cumulative: list[float] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        self._rebuild()
+
+    def distance(self, a, b):
+        key = (a.lon, a.lat, b.lon, b.lat)
+        if key > (b.lon, b.lat, a.lon, a.lat):
+            key = (b.lon, b.lat, a.lon, a.lat)
+        value = self._matrix.get(key)
+        if value is None:
+            value = self._matrix[key] = a.distance_to(b)
+        return value
+
+    def _rebuild(self):
+        total = 0.0
+        self._cumulative = [0.0] * len(self.stops)
+        for i in range(1, len(self.stops)):
+            total += self.distance(self.stops[i - 1], self.stops[i])
+            self._cumulative[i] = total
+
+    def _shift(self, start, delta):
+        cumulative = self._cumulative
+        for i in range(start, len(cumulative)):
+            cumulative[i] += delta
+
+    @property
+    def total_length(self):
+        return self._cumulative[-1] if self._cumulative else 0.0
+
+    def cumulative_lengths(self):
+        return list(self._cumulative)
+
+    def length_of(self, order, closed=False):
+        # Length of the route visiting stops in the given index order
+        stops = self.stops
+        total = sum(
+            self.distance(stops[i], stops[j]) for i, j in zip(order, order[1:])
+        )
+        if closed and len(order) > 1:
+            total += self.distance(stops[order[-1]], stops[order[0]])
+        return total
+
+    def append(self, stop):
+        self.insert(len(self.stops), stop)
+
+    def insert(self, index, stop):
+        stops = self.stops
+        index = max(0, min(index, len(stops)))
+        prev = stops[index - 1] if index > 0 else None
+        nxt = stops[index] if index < len(stops) else None
+
+        delta = 0.0
+        if prev is not None:
+            delta += self.distance(prev, stop)
+        if nxt is not None:
+            delta += self.distance(stop, nxt)
+        if prev is not None and nxt is not None:
+            delta -= self.distance(prev, nxt)
+
+        stops.insert(index, stop)
+        start = self._cumulative[index - 1] if index > 0 else 0.0
+        self._cumulative.insert(
+            index, start + (self.distance(prev, stop) if prev is not None else 0.0)
+        )
+        self._shift(index + 1, delta)
+
+    def remove(self, index):
+        stops = self.stops
+        stop = stops[index]
+        index = index % len(stops)
+        prev = stops[index - 1] if index > 0 else None
+        nxt = stops[index + 1] if index + 1 < len(stops) else None
+
+        if prev is None:
+            delta = -self.distance(stop, nxt) if nxt is not None else 0.0
+        elif nxt is None:
+            delta = 0.0
+        else:
+            delta = (
+                self.distance(prev, nxt)
+                - self.distance(prev, stop)
+                - self.distance(stop, nxt)
+            )
+
+        del stops[index]
+        del self._cumulative[index]
+        self._shift(index, delta)
+        return stop
+
+    def move(self, source, target):
+        self.insert(target, self.remove(source))
+
+    def optimize(self, closed=False):
+        # Nearest neighbour tour from the first stop improved by 2-opt
+        n = len(self.stops)
+        if n < 3:
+            return self.length_of(list(range(n)), closed=closed)
+
+        stops = self.stops
+        matrix = [[self.distance(a, b) for b in stops] for a in stops]
+
+        order = [0]
+        remaining = set(range(1, n))
+        while remaining:
+            row = matrix[order[-1]]
+            nearest = min(remaining, key=row.__getitem__)
+            remaining.remove(nearest)
+            order.append(nearest)
+
+        improved = True
+        while improved:
+            improved = False
+            for i in range(1, n - 1):
+                a, b = order[i - 1], order[i]
+                for k in range(i + 1, n):
+                    c = order[k]
+                    d = order[(k + 1) % n] if closed or k + 1 < n else None
+                    delta = matrix[a][c] - matrix[a][b]
+                    if d is not None:
+                        delta += matrix[b][d] - matrix[c][d]
+                    if delta < -1e-9:
+                        order[i : k + 1] = reversed(order[i : k + 1])
+                        b = order[i]
+                        improved = True
+
+        self.stops = [stops[i] for i in order]
+        self._rebuild()
+        return self.length_of(list(range(n)), closed=closed)
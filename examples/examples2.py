@@ -1,10 +1,30 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+# Тяжёлые модули (xml, sqlite3, concurrent.futures, argparse, mmap)
+# импортируются при первом использовании, чтобы не замедлять запуск
+import os
+import re
 import sys
-import xml.etree.ElementTree as ET
+from bisect import bisect_right, insort
 from dataclasses import dataclass, field
-from datetime import date
+from operator import attrgetter
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+from task_package import instrumentation
+from task_package.memory import sizeof
+from task_package.views import SequenceView
+
+if TYPE_CHECKING:
+    import sqlite3
+
+SNAPSHOT_MAGIC = b"WRKS"
+SNAPSHOT_SCHEMA = "ssi"
+# Начало элемента worker с атрибутами или без (но не <workers>)
+WORKER_START = re.compile(rb"<worker[\s/>]")
+# Поля, по которым можно упорядочивать работников
+SORT_FIELDS = ("name", "post", "year")
 
 
 @dataclass(frozen=True)
@@ -14,129 +34,795 @@ class Worker:
     year: int
 
 
+def _read_workers(tree):
+    for worker_element in tree:
+        name, post, year = None, None, None
+        for element in worker_element:
+            if element.tag == "name":
+                name = element.text
+            elif element.tag == "post":
+                post = element.text
+            elif element.tag == "year":
+                year = int(element.text)
+
+        if name is not None and post is not None and year is not None:
+            yield name, post, year
+
+
+def _split_worker_chunks(data, parts):
+    # Делит документ на диапазоны байт, каждый из которых начинается с <worker>.
+    # Документы с комментариями и CDATA не делятся: граница могла бы попасть
+    # внутрь них, поэтому для них возвращается пустой список
+    if b"<!--" in data or b"<![CDATA[" in data:
+        return []
+    match = WORKER_START.search(data)
+    end = data.rfind(b"</workers>")
+    if match is None or end == -1:
+        return []
+
+    bounds = [match.start()]
+    step = max((end - bounds[0]) // parts, 1)
+    for i in range(1, parts):
+        match = WORKER_START.search(
+            data, max(bounds[0] + i * step, bounds[-1] + 1), end
+        )
+        if match is None:
+            break
+        bounds.append(match.start())
+    bounds.append(end)
+    return [(lo, hi) for lo, hi in zip(bounds, bounds[1:]) if lo < hi]
+
+
+def _parse_worker_chunk(chunk):
+    import xml.etree.ElementTree as ET
+
+    tree = ET.fromstring(b"<workers>" + chunk + b"</workers>")
+    return list(_read_workers(tree))
+
+
+def _worker_element(worker):
+    import xml.etree.ElementTree as ET
+
+    worker_element = ET.Element("worker")
+
+    name_element = ET.SubElement(worker_element, "name")
+    name_element.text = worker.name
+
+    post_element = ET.SubElement(worker_element, "post")
+    post_element.text = worker.post
+
+    year_element = ET.SubElement(worker_element, "year")
+    year_element.text = str(worker.year)
+
+    return worker_element
+
+
+def format_table(workers):
+    table = []
+    line = "+{}+{}+{}+{}+".format("-" * 4, "-" * 30, "-" * 20, "-" * 8)
+    table.append(line)
+    table.append(
+        "| {:^4} | {:^30} | {:^20} | {:^8} |".format("№", "Ф.И.О.", "Должность", "Год")
+    )
+    table.append(line)
+
+    for idx, worker in enumerate(workers, 1):
+        table.append(
+            "| {:^4} | {:<30} | {:<20} | {:>8} |".format(
+                idx, worker.name, worker.post, worker.year
+            )
+        )
+    table.append(line)
+    return "\n".join(table)
+
+
+def _worker_name(worker):
+    return worker.name
+
+
+def _worker_year(worker):
+    return worker.year
+
+
+def sort_spec(order):
+    # Порядок сортировки с ФИО в конце, чтобы он не зависел от порядка вставки
+    spec = tuple(order)
+    for key in spec:
+        if key not in SORT_FIELDS:
+            raise ValueError(f"Unknown sort field: {key}")
+    if "name" not in spec:
+        spec += ("name",)
+    return spec
+
+
+class _WorkersField:
+    # Поле workers класса Staff: конструктор и присваивание передают работников
+    # в _set_workers, а чтение возвращает представление только для чтения,
+    # чтобы список нельзя было изменить в обход индекса и кэша порядков
+    def __get__(self, staff, owner=None):
+        if staff is None:
+            # Значение по умолчанию для конструктора dataclass
+            return ()
+        return staff.sorted_by()
+
+    def __set__(self, staff, workers):
+        staff._set_workers(workers)
+
+
+def journal_name(filename):
+    return filename + ".journal"
+
+
+def _read_journal(filename):
+    # Записи, дописанные в журнал файла после его последней перезаписи
+    try:
+        with open(journal_name(filename), "rb") as fin:
+            chunk = fin.read()
+    except FileNotFoundError:
+        return []
+    return _parse_worker_chunk(chunk)
+
+
+def _remove_journal(filename):
+    if os.path.exists(journal_name(filename)):
+        os.remove(journal_name(filename))
+
+
 @dataclass
 class Staff:
-    workers: list[Worker] = field(default_factory=list)
+    # Основное хранилище - индекс ФИО -> работник (последний добавленный с этим
+    # ФИО), поэтому get, remove и upsert выполняются за O(1). Поля объявлены
+    # до workers: конструктор передаёт workers в _set_workers, который их
+    # заполняет
+    _index: dict[str, Worker] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # Более ранние работники с тем же ФИО в порядке добавления
+    _shadowed: dict[str, list[Worker]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # Кэш упорядоченных списков: порядок -> (ключ сортировки, список);
+    # список по ФИО - это workers
+    _orders: dict[tuple, tuple] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # ФИО, записи которых в упорядоченных списках устарели после remove/upsert;
+    # списки исправляются одним проходом при следующем обращении
+    _stale: set[str] = field(default_factory=set, init=False, repr=False, compare=False)
+    # Счётчик изменений для проверки представлений sorted_by
+    _version: int = field(default=0, init=False, repr=False, compare=False)
+    workers: _WorkersField = _WorkersField()
+    # Число записей в журнале, после которого save переписывает основной файл
+    compact_threshold: int = field(default=1000, repr=False, compare=False)
+    # Файл, с которым синхронизированы workers (не считая _pending)
+    _base: str | None = field(default=None, init=False, repr=False, compare=False)
+    _pending: list[Worker] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    _journaled: int = field(default=0, init=False, repr=False, compare=False)
+    # Требуется полная перезапись: были изменения, которые журнал не выражает
+    _rewrite: bool = field(default=False, init=False, repr=False, compare=False)
+    metrics: instrumentation.Instrumentation | None = field(
+        default_factory=instrumentation.current, repr=False, compare=False
+    )
+
+    def _set_workers(self, workers, dedup=False, rewrite=True):
+        # Дубликаты отбрасываются через хеш Worker с сохранением порядка.
+        # Замену списка журнал не выражает, поэтому save перепишет файл;
+        # загрузка передаёт rewrite=False, так как данные совпадают с файлом
+        if dedup:
+            workers = dict.fromkeys(workers)
+        workers = list(workers)
+        self._index = {worker.name: worker for worker in workers}
+        self._shadowed = {}
+        if len(self._index) != len(workers):
+            self._index = {}
+            for worker in workers:
+                self._put(worker)
+        self._invalidate()
+        if rewrite:
+            self._rewrite = True
+
+    def _put(self, worker):
+        previous = self._index.get(worker.name)
+        if previous is not None:
+            self._shadowed.setdefault(worker.name, []).append(previous)
+        self._index[worker.name] = worker
+
+    def _invalidate(self):
+        self._orders.clear()
+        self._stale.clear()
+        self._version += 1
+
+    def _touch(self, name):
+        if self._orders:
+            self._stale.add(name)
+        self._version += 1
+
+    def _refresh(self):
+        # Записи устаревших ФИО заменяются текущими; остаток списка уже
+        # упорядочен, и Timsort сливает его с короткой добавкой за O(n)
+        stale = self._stale
+        if not stale:
+            return
+        fresh = []
+        for name in stale:
+            fresh.extend(self._shadowed.get(name, ()))
+            if name in self._index:
+                fresh.append(self._index[name])
+        for spec, (key, ordered) in self._orders.items():
+            ordered = [worker for worker in ordered if worker.name not in stale]
+            ordered.extend(fresh)
+            ordered.sort(key=key)
+            self._orders[spec] = (key, ordered)
+        stale.clear()
+
+    def _ordered(self, order):
+        self._refresh()
+        spec = sort_spec(order)
+        cached = self._orders.get(spec)
+        if cached is None:
+            key = _worker_name if spec == ("name",) else attrgetter(*spec)
+            workers = []
+            for name, worker in self._index.items():
+                if self._shadowed and name in self._shadowed:
+                    workers.extend(self._shadowed[name])
+                workers.append(worker)
+            cached = self._orders[spec] = (key, sorted(workers, key=key))
+        return cached[1]
+
+    def _current_version(self):
+        return self._version
+
+    def sorted_by(self, *order):
+        # Упорядоченный список строится один раз и дополняется при add
+        return SequenceView(self._ordered(order), self._current_version)
 
     def add(self, name, post, year):
-        self.workers.append(Worker(name=name, post=post, year=year))
-        self.workers.sort(key=lambda worker: worker.name)
-
-    def select(self, period):
-        today = date.today()
-        result = []
-        for worker in self.workers:
-            if today.year - worker.year >= int(period):
-                result.append(worker)
+        if self.metrics is not None:
+            self.metrics.incr("staff.add")
+        worker = Worker(name=name, post=post, year=year)
+        self._put(worker)
+        if name not in self._stale:
+            # Вставка в готовые списки: поиск за O(log n) и сдвиг хвоста memmove
+            for key, ordered in self._orders.values():
+                insort(ordered, worker, key=key)
+        self._version += 1
+        if self._base is not None:
+            self._pending.append(worker)
+
+    def add_many(self, workers):
+        # Готовые списки исправляются одной сортировкой при следующем обращении
+        workers = list(workers)
+        if self.metrics is not None:
+            self.metrics.incr("staff.add", len(workers))
+        for worker in workers:
+            self._put(worker)
+            self._touch(worker.name)
+        if self._base is not None:
+            self._pending.extend(workers)
+
+    def get(self, name):
+        return self._index.get(name)
+
+    def remove(self, name):
+        if self.metrics is not None:
+            self.metrics.incr("staff.remove")
+        if self._index.pop(name, None) is None:
+            return False
+        self._shadowed.pop(name, None)
+        self._touch(name)
+        self._rewrite = True
+        return True
+
+    def upsert(self, name, post, year):
+        if self.metrics is not None:
+            self.metrics.incr("staff.upsert")
+        if name not in self._index:
+            self.add(name, post, year)
+            return
+
+        self._index[name] = Worker(name=name, post=post, year=year)
+        self._shadowed.pop(name, None)
+        self._touch(name)
+        self._rewrite = True
+
+    def _track(self, filename, journaled):
+        self._base = filename
+        self._pending = []
+        self._journaled = journaled
+        self._rewrite = False
+
+    def _load_records(self, filename, records, start):
+        # start - момент начала загрузки, чтобы отделить разбор от построения
+        journal = _read_journal(filename)
+        if self.metrics is not None:
+            built = perf_counter()
+            self.metrics.observe("staff.load.parse", built - start)
+        self._set_workers(
+            [
+                Worker(name=name, post=post, year=year)
+                for name, post, year in records + journal
+            ],
+            dedup=True,
+            rewrite=False,
+        )
+        self._track(filename, len(journal))
+        if self.metrics is not None:
+            self.metrics.observe("staff.load.build", perf_counter() - built)
+            self.metrics.incr("staff.load.workers", len(self.workers))
+
+    def select(self, period, order=()):
+        from datetime import date
+
+        start = perf_counter() if self.metrics is not None else 0.0
+        max_year = date.today().year - int(period)
+        spec = sort_spec(order)
+        workers = self._ordered(spec)
+        if spec[0] == "year":
+            # Список упорядочен по году: подходящие работники образуют префикс
+            result = workers[: bisect_right(workers, max_year, key=_worker_year)]
+        else:
+            result = [worker for worker in workers if worker.year <= max_year]
+        if self.metrics is not None:
+            self.metrics.observe("staff.select", perf_counter() - start)
         return result
 
+    def stats(self):
+        return self.metrics.snapshot() if self.metrics is not None else {}
+
+    def memory_usage(self, deep=True):
+        return sizeof(self, deep, exclude=("metrics",))
+
+    def intern_strings(self):
+        # Worker неизменяем, поэтому работники с повторной должностью
+        # пересоздаются со ссылкой на общую строку
+        pool = {}
+        renamed = {}
+        for worker in [*self._ordered(("name",)), *self._pending]:
+            post = pool.setdefault(worker.post, worker.post)
+            if post is not worker.post and id(worker) not in renamed:
+                renamed[id(worker)] = Worker(
+                    name=worker.name, post=post, year=worker.year
+                )
+
+        if renamed:
+            self._set_workers(
+                [renamed.get(id(w), w) for w in self._ordered(("name",))],
+                rewrite=False,
+            )
+            self._pending = [renamed.get(id(w), w) for w in self._pending]
+        return len(renamed)
+
     def load(self, filename):
+        import xml.etree.ElementTree as ET
+
+        start = perf_counter()
         with open(filename, "r", encoding="utf8") as fin:
             xml = fin.read()
 
         parser = ET.XMLParser(encoding="utf8")
         tree = ET.fromstring(xml, parser=parser)
 
-        self.workers = []
-        for worker_element in tree:
-            name, post, year = None, None, None
-            for element in worker_element:
-                if element.tag == "name":
-                    name = element.text
-                elif element.tag == "post":
-                    post = element.text
-                elif element.tag == "year":
-                    year = int(element.text)
+        self._load_records(filename, list(_read_workers(tree)), start)
+
+    def load_parallel(self, filename, max_workers=None):
+        # Разбор крупного файла по частям в нескольких процессах; если документ
+        # нельзя надёжно разделить, он загружается обычным образом
+        import xml.etree.ElementTree as ET
+        from concurrent.futures import ProcessPoolExecutor
+
+        start = perf_counter()
+        with open(filename, "rb") as fin:
+            data = fin.read()
+
+        max_workers = max_workers or os.cpu_count() or 1
+        chunks = [data[lo:hi] for lo, hi in _split_worker_chunks(data, max_workers)]
+        if not chunks:
+            self.load(filename)
+            return
+
+        try:
+            if max_workers == 1 or len(chunks) <= 1:
+                results = map(_parse_worker_chunk, chunks)
+                records = [record for result in results for record in result]
+            else:
+                with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                    results = executor.map(_parse_worker_chunk, chunks)
+                    records = [record for result in results for record in result]
+        except ET.ParseError:
+            self.load(filename)
+            return
 
-            if name is not None and post is not None and year is not None:
-                self.workers.append(Worker(name=name, post=post, year=year))
+        self._load_records(filename, records, start)
 
     def save(self, filename):
-        root = ET.Element("workers")
-        for worker in self.workers:
-            worker_element = ET.Element("worker")
+        # Если с последней загрузки/сохранения этого файла были только
+        # добавления, они дописываются в журнал без перезаписи документа
+        import xml.etree.ElementTree as ET
+
+        if filename != self._base or self._rewrite or not os.path.exists(filename):
+            self.compact(filename)
+            return
 
-            name_element = ET.SubElement(worker_element, "name")
-            name_element.text = worker.name
+        if self._pending:
+            with open(journal_name(filename), "ab") as fout:
+                for worker in self._pending:
+                    fout.write(ET.tostring(_worker_element(worker)) + b"\n")
+            self._journaled += len(self._pending)
+            if self.metrics is not None:
+                self.metrics.incr("staff.save.journaled", len(self._pending))
+            self._pending = []
 
-            post_element = ET.SubElement(worker_element, "post")
-            post_element.text = worker.post
+        if self._journaled >= self.compact_threshold:
+            self.compact(filename)
 
-            year_element = ET.SubElement(worker_element, "year")
-            year_element.text = str(worker.year)
+    def compact(self, filename=None):
+        # Полная перезапись основного файла с удалением журнала
+        import xml.etree.ElementTree as ET
 
-            root.append(worker_element)
+        filename = filename or self._base
+        if filename is None:
+            raise ValueError("Не задано имя файла для сохранения")
+        if self.metrics is not None:
+            self.metrics.incr("staff.save.compact")
+
+        root = ET.Element("workers")
+        for worker in self._ordered(("name",)):
+            root.append(_worker_element(worker))
 
         tree = ET.ElementTree(root)
-        with open(filename, "wb") as fout:
+        temp_name = filename + ".tmp"
+        with open(temp_name, "wb") as fout:
             tree.write(fout, encoding="utf8", xml_declaration=True)
+        os.replace(temp_name, filename)
+
+        _remove_journal(filename)
+        self._track(filename, 0)
+
+    def save_snapshot(self, filename):
+        from task_package.snapshot import write_snapshot
+
+        write_snapshot(
+            filename,
+            SNAPSHOT_MAGIC,
+            SNAPSHOT_SCHEMA,
+            (
+                (worker.name, worker.post, worker.year)
+                for worker in self._ordered(("name",))
+            ),
+        )
+
+    @staticmethod
+    def open_snapshot(filename):
+        # Работники декодируются из файла только при обращении к ним
+        from task_package.snapshot import SnapshotView
+
+        return SnapshotView(filename, SNAPSHOT_MAGIC, SNAPSHOT_SCHEMA, Worker)
+
+    def load_snapshot(self, filename):
+        with self.open_snapshot(filename) as snapshot:
+            self._set_workers(list(snapshot), dedup=True, rewrite=False)
+        self._track(None, 0)
+
+    def report(self, *order):
+        return format_table(self._ordered(order))
 
     def __str__(self):
-        table = []
-        line = "+{}+{}+{}+{}+".format("-" * 4, "-" * 30, "-" * 20, "-" * 8)
-        table.append(line)
-        table.append(
-            "| {:^4} | {:^30} | {:^20} | {:^8} |".format(
-                "№", "Ф.И.О.", "Должность", "Год"
+        return format_table(self._ordered(("name",)))
+
+
+@dataclass
+class SqliteStaff:
+    # Хранилище работников в файле SQLite: данные не обязаны помещаться в память
+    database: str = ":memory:"
+    batch_size: int = field(default=10_000, repr=False, compare=False)
+    _connection: "sqlite3.Connection" = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        import sqlite3
+
+        self._connection = sqlite3.connect(self.database)
+        self._connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS workers (
+                name TEXT NOT NULL,
+                post TEXT NOT NULL,
+                year INTEGER NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS workers_name ON workers (name);
+            CREATE INDEX IF NOT EXISTS workers_year ON workers (year);
+            """
+        )
+
+    def _query(self, sql, parameters=()):
+        cursor = self._connection.execute(sql, parameters)
+        while rows := cursor.fetchmany(self.batch_size):
+            for name, post, year in rows:
+                yield Worker(name=name, post=post, year=year)
+
+    def _insert(self, records):
+        # Вставка пачками по batch_size строк в одной транзакции
+        batch = []
+        with self._connection:
+            for record in records:
+                batch.append(record)
+                if len(batch) >= self.batch_size:
+                    self._connection.executemany(
+                        "INSERT INTO workers VALUES (?, ?, ?)", batch
+                    )
+                    batch = []
+            if batch:
+                self._connection.executemany(
+                    "INSERT INTO workers VALUES (?, ?, ?)", batch
+                )
+
+    @property
+    def workers(self):
+        return list(self)
+
+    def __iter__(self):
+        return self._query("SELECT name, post, year FROM workers ORDER BY name, rowid")
+
+    def __len__(self):
+        (count,) = self._connection.execute("SELECT COUNT(*) FROM workers").fetchone()
+        return count
+
+    def add(self, name, post, year):
+        self._insert([(name, post, year)])
+
+    def add_many(self, workers):
+        self._insert((worker.name, worker.post, worker.year) for worker in workers)
+
+    def get(self, name):
+        rows = self._query(
+            "SELECT name, post, year FROM workers WHERE name = ? "
+            "ORDER BY rowid DESC LIMIT 1",
+            (name,),
+        )
+        return next(rows, None)
+
+    def remove(self, name):
+        with self._connection:
+            cursor = self._connection.execute(
+                "DELETE FROM workers WHERE name = ?", (name,)
+            )
+        return cursor.rowcount > 0
+
+    def upsert(self, name, post, year):
+        with self._connection:
+            self._connection.execute("DELETE FROM workers WHERE name = ?", (name,))
+            self._connection.execute(
+                "INSERT INTO workers VALUES (?, ?, ?)", (name, post, year)
+            )
+
+    def sorted_by(self, *order):
+        # Имена полей проверены sort_spec, поэтому их можно подставить в запрос
+        columns = ", ".join(sort_spec(order))
+        return list(
+            self._query(
+                f"SELECT name, post, year FROM workers ORDER BY {columns}, rowid"
+            )
+        )
+
+    def select(self, period, order=()):
+        from datetime import date
+
+        max_year = date.today().year - int(period)
+        columns = ", ".join(sort_spec(order))
+        return list(
+            self._query(
+                "SELECT name, post, year FROM workers WHERE year <= ? "
+                f"ORDER BY {columns}, rowid",
+                (max_year,),
             )
         )
-        table.append(line)
 
-        for idx, worker in enumerate(self.workers, 1):
-            table.append(
-                "| {:^4} | {:<30} | {:<20} | {:>8} |".format(
-                    idx, worker.name, worker.post, worker.year
+    def clear(self):
+        with self._connection:
+            self._connection.execute("DELETE FROM workers")
+
+    def load(self, filename):
+        import xml.etree.ElementTree as ET
+
+        # Потоковый разбор: в памяти находится только текущий элемент <worker>
+        # Файлы объявляют кодировку "utf8", которую expat не распознаёт сам
+        def records():
+            parser = ET.XMLParser(encoding="utf-8")
+            for _, element in ET.iterparse(filename, parser=parser):
+                if element.tag == "worker":
+                    yield from _read_workers([element])
+                    element.clear()
+            yield from _read_journal(filename)
+
+        self.clear()
+        self._insert(records())
+
+    def save(self, filename):
+        import xml.etree.ElementTree as ET
+
+        with open(filename, "wb") as fout:
+            fout.write(b"<?xml version='1.0' encoding='utf8'?>\n<workers>")
+            for worker in self:
+                fout.write(ET.tostring(_worker_element(worker)))
+            fout.write(b"</workers>")
+        # Журнал относится к прежнему содержимому файла
+        _remove_journal(filename)
+
+    def compact(self):
+        self._connection.execute("VACUUM")
+
+    def save_snapshot(self, filename):
+        from task_package.snapshot import write_snapshot
+
+        write_snapshot(
+            filename,
+            SNAPSHOT_MAGIC,
+            SNAPSHOT_SCHEMA,
+            ((worker.name, worker.post, worker.year) for worker in self),
+        )
+
+    def load_snapshot(self, filename):
+        self.clear()
+        with Staff.open_snapshot(filename) as snapshot:
+            self.add_many(snapshot)
+
+    def close(self):
+        self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def report(self, *order):
+        return format_table(self.sorted_by(*order))
+
+    def __str__(self):
+        return format_table(self)
+
+
+HELP = """Список команд:
+
+add - добавить работника;
+list [поле ...] - вывести список работников, упорядоченный по полям
+    name, post, year (по умолчанию по ФИО);
+select <стаж> [поле ...] - запросить работников со стажем;
+load <имя_файла> - загрузить данные из файла;
+save <имя_файла> - сохранить данные в файл;
+compact - переписать файл данных с учётом журнала;
+load-bin <имя_файла> - загрузить данные из бинарного снимка;
+save-bin <имя_файла> - сохранить данные в бинарный снимок;
+help - отобразить справку;
+exit - завершить работу с программой."""
+
+
+def execute(staff, command, write):
+    # Выполнение одной команды, кроме add; возвращает False для exit
+    if command == "exit":
+        return False
+
+    elif command == "list" or command.startswith("list "):
+        try:
+            write(f"{staff.report(*command.split()[1:])}\n")
+        except ValueError as exc:
+            print(exc, file=sys.stderr)
+
+    elif command.startswith("select "):
+        parts = command.split()
+        try:
+            selected = staff.select(parts[1], order=parts[2:])
+        except ValueError as exc:
+            print(exc, file=sys.stderr)
+            return True
+
+        if selected:
+            write(
+                "".join(
+                    "{:>4}: {}\n".format(idx, worker.name)
+                    for idx, worker in enumerate(selected, 1)
                 )
             )
-        table.append(line)
-        return "\n".join(table)
+        else:
+            write("Работники с заданным стажем не найдены.\n")
 
+    elif command.startswith("load "):
+        parts = command.split(maxsplit=1)
+        staff.load(parts[1])
 
-if __name__ == "__main__":
-    staff = Staff()
+    elif command.startswith("save "):
+        parts = command.split(maxsplit=1)
+        staff.save(parts[1])
+
+    elif command == "compact":
+        try:
+            staff.compact()
+        except ValueError as exc:
+            print(exc, file=sys.stderr)
 
+    elif command.startswith("load-bin "):
+        parts = command.split(maxsplit=1)
+        staff.load_snapshot(parts[1])
+
+    elif command.startswith("save-bin "):
+        parts = command.split(maxsplit=1)
+        staff.save_snapshot(parts[1])
+
+    elif command == "help":
+        write(f"{HELP}\n")
+
+    else:
+        print(f"Неизвестная команда {command}", file=sys.stderr)
+
+    return True
+
+
+def run_interactive(staff):
     while True:
         command = input(">>> ").lower()
 
-        if command == "exit":
-            break
-
-        elif command == "add":
+        if command == "add":
             name = input("Фамилия и инициалы? ")
             post = input("Должность? ")
             year = int(input("Год поступления? "))
             staff.add(name, post, year)
 
-        elif command == "list":
-            print(staff)
+        elif not execute(staff, command, sys.stdout.write):
+            break
 
-        elif command.startswith("select "):
-            parts = command.split(maxsplit=1)
-            selected = staff.select(parts[1])
 
-            if selected:
-                for idx, worker in enumerate(selected, 1):
-                    print("{:>4}: {}".format(idx, worker.name))
-            else:
-                print("Работники с заданным стажем не найдены.")
-
-        elif command.startswith("load "):
-            parts = command.split(maxsplit=1)
-            staff.load(parts[1])
-
-        elif command.startswith("save "):
-            parts = command.split(maxsplit=1)
-            staff.save(parts[1])
-
-        elif command == "help":
-            print("Список команд:\n")
-            print("add - добавить работника;")
-            print("list - вывести список работников;")
-            print("select <стаж> - запросить работников со стажем;")
-            print("load <имя_файла> - загрузить данные из файла;")
-            print("save <имя_файла> - сохранить данные в файл;")
-            print("help - отобразить справку;")
-            print("exit - завершить работу с программой.")
+def run_batch(staff, lines, out):
+    # Команды читаются из потока в том же виде, что и в интерактивном режиме:
+    # после add следуют три строки с ФИО, должностью и годом. Добавления
+    # копятся и передаются в add_many одной пачкой перед следующей командой
+    lines = (line.rstrip("\n") for line in lines)
+    pending = []
+    for line in lines:
+        command = line.lower()
+        if not command:
+            continue
 
-        else:
-            print(f"Неизвестная команда {command}", file=sys.stderr)
+        if command == "add":
+            try:
+                name, post, year = next(lines), next(lines), int(next(lines))
+            except StopIteration:
+                print("Команда add без данных работника", file=sys.stderr)
+                break
+            pending.append(Worker(name=name, post=post, year=year))
+            continue
+
+        if pending:
+            staff.add_many(pending)
+            pending = []
+        if not execute(staff, command, out.write):
+            break
+
+    if pending:
+        staff.add_many(pending)
+    out.flush()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Учёт работников")
+    parser.add_argument("--sqlite", metavar="DATABASE", help="хранить данные в SQLite")
+    parser.add_argument(
+        "--batch",
+        metavar="SCRIPT",
+        nargs="?",
+        const="-",
+        help="выполнить команды из файла или стандартного ввода",
+    )
+    args = parser.parse_args()
+
+    staff = SqliteStaff(args.sqlite) if args.sqlite else Staff()
+
+    if args.batch is None:
+        run_interactive(staff)
+    elif args.batch == "-":
+        run_batch(staff, sys.stdin, sys.stdout)
+    else:
+        with open(args.batch, "r", encoding="utf8") as fin:
+            run_batch(staff, fin, sys.stdout)
@@ -0,0 +1,115 @@
+import os
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, Optional
+
+# Приёмник событий: вызывается с именем метрики и значением
+# (приращение счётчика или длительность в секундах)
+Sink = Callable[[str, float], None]
+
+
+@dataclass
+class Histogram:
+    """Гистограмма длительностей с корзинами по степеням двойки микросекунд"""
+
+    count: int = 0
+    total: float = 0.0
+    min: float = float("inf")
+    max: float = 0.0
+    buckets: Dict[int, int] = field(default_factory=dict)
+
+    def observe(self, seconds: float) -> None:
+        """Добавление одного измерения"""
+        self.count += 1
+        self.total += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+        bound = 1 << int(seconds * 1_000_000).bit_length()
+        self.buckets[bound] = self.buckets.get(bound, 0) + 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Копия текущего состояния гистограммы"""
+        return {
+            "count": self.count,
+            "total": self.total,
+            "min": self.min if self.count else 0.0,
+            "max": self.max,
+            "buckets_us": dict(sorted(self.buckets.items())),
+        }
+
+
+@dataclass
+class Instrumentation:
+    """Счётчики и гистограммы времени для одного или нескольких объектов.
+
+    Классы пакета хранят ссылку на Instrumentation или None; в последнем
+    случае горячие пути ограничиваются одной проверкой на None.
+    """
+
+    sink: Optional[Sink] = None
+    counters: Dict[str, int] = field(default_factory=dict)
+    timings: Dict[str, Histogram] = field(default_factory=dict)
+
+    def incr(self, name: str, value: int = 1) -> None:
+        """Увеличение счётчика"""
+        self.counters[name] = self.counters.get(name, 0) + value
+        if self.sink is not None:
+            self.sink(name, value)
+
+    def observe(self, name: str, seconds: float) -> None:
+        """Добавление измерения длительности"""
+        histogram = self.timings.get(name)
+        if histogram is None:
+            histogram = self.timings[name] = Histogram()
+        histogram.observe(seconds)
+        if self.sink is not None:
+            self.sink(name, seconds)
+
+    @contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        """Измерение длительности блока кода"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Копия всех метрик"""
+        return {
+            "counters": dict(self.counters),
+            "timings": {
+                name: histogram.snapshot() for name, histogram in self.timings.items()
+            },
+        }
+
+    def reset(self) -> None:
+        """Сброс всех метрик"""
+        self.counters.clear()
+        self.timings.clear()
+
+
+_default: Optional[Instrumentation] = None
+
+
+def enable(sink: Optional[Sink] = None) -> Instrumentation:
+    """Включение общего сбора метрик для всех создаваемых далее объектов"""
+    global _default
+    _default = Instrumentation(sink=sink)
+    return _default
+
+
+def disable() -> None:
+    """Отключение общего сбора метрик для создаваемых далее объектов"""
+    global _default
+    _default = None
+
+
+def current() -> Optional[Instrumentation]:
+    """Общий объект метрик или None, если сбор отключён"""
+    return _default
+
+
+if os.environ.get("TASK_PACKAGE_INSTRUMENT"):
+    enable()
@@ -0,0 +1,57 @@
+import sys
+from collections import deque
+from types import BuiltinFunctionType, FunctionType, MethodType, ModuleType
+from typing import Any, Iterable, List, Optional, Set, Tuple
+
+# Объекты, которыми контейнер не владеет: они не учитываются и не обходятся
+_OPAQUE = (type, ModuleType, FunctionType, MethodType, BuiltinFunctionType)
+_ATOMIC = (str, bytes, int, float, complex, bool, type(None))
+
+
+def _attributes(obj: Any, exclude: frozenset) -> Tuple[int, List[Any]]:
+    """Размер словаря атрибутов объекта и значения его атрибутов"""
+    size = 0
+    values = []
+    namespace = getattr(obj, "__dict__", None)
+    if isinstance(namespace, dict):
+        size = sys.getsizeof(namespace)
+        values = [value for name, value in namespace.items() if name not in exclude]
+    for name in getattr(type(obj), "__slots__", ()):
+        if name not in exclude and hasattr(obj, name):
+            values.append(getattr(obj, name))
+    return size, values
+
+
+def sizeof(obj: Any, deep: bool = True, exclude: Iterable[str] = ()) -> int:
+    """Размер объекта в байтах вместе с объектами, которыми он владеет.
+
+    Каждый объект учитывается один раз, поэтому общие строки и повторные
+    ссылки на одни и те же элементы не удваивают результат. При deep=False
+    учитываются только сам объект и значения его атрибутов (например, массив
+    ссылок списка без самих элементов). Атрибуты с именами из exclude
+    пропускаются на всех уровнях.
+    """
+    names = frozenset(exclude)
+    max_depth: Optional[int] = None if deep else 1
+    seen: Set[int] = set()
+    total = 0
+    stack: List[Tuple[Any, int]] = [(obj, 0)]
+    while stack:
+        item, depth = stack.pop()
+        if id(item) in seen or isinstance(item, _OPAQUE):
+            continue
+        seen.add(id(item))
+        total += sys.getsizeof(item)
+        if isinstance(item, _ATOMIC):
+            continue
+
+        if isinstance(item, dict):
+            children: List[Any] = [*item.keys(), *item.values()]
+        elif isinstance(item, (list, tuple, set, frozenset, deque)):
+            children = list(item)
+        else:
+            namespace_size, children = _attributes(item, names)
+            total += namespace_size
+        if max_depth is None or depth < max_depth:
+            stack.extend((child, depth + 1) for child in children)
+    return total
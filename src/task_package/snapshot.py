@@ -0,0 +1,196 @@
+import mmap
+import os
+import struct
+from typing import (
+    Any,
+    Callable,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+    overload,
+)
+
+T = TypeVar("T")
+
+# Формат снимка:
+#   заголовок  : magic (4 байта), версия (u16), схема (8 байт), число записей (u64)
+#   смещения   : u64 на каждую запись (абсолютное смещение в файле)
+#   записи     : поля по схеме, "s" - u32 длина + UTF-8, "i" - i64
+VERSION = 1
+_HEADER = struct.Struct("<4sH8sQ")
+_OFFSET = struct.Struct("<Q")
+_LENGTH = struct.Struct("<I")
+_INT = struct.Struct("<q")
+
+
+def _check_schema(schema: str) -> bytes:
+    """Проверка схемы записи и её бинарное представление"""
+    if not schema or len(schema) > 8 or set(schema) - {"s", "i"}:
+        raise ValueError(f"Invalid snapshot schema: {schema!r}")
+    return schema.encode("ascii").ljust(8, b"\0")
+
+
+def _encode_record(schema: str, record: Tuple[Any, ...]) -> bytes:
+    """Кодирование одной записи по схеме"""
+    if len(record) != len(schema):
+        raise ValueError(f"Record {record!r} does not match schema {schema!r}")
+    parts = []
+    for kind, value in zip(schema, record):
+        if kind == "s":
+            data = value.encode("utf-8")
+            parts.append(_LENGTH.pack(len(data)))
+            parts.append(data)
+        else:
+            parts.append(_INT.pack(value))
+    return b"".join(parts)
+
+
+def write_snapshot(
+    filename: str, magic: bytes, schema: str, records: Iterable[Tuple[Any, ...]]
+) -> None:
+    """Запись последовательности записей в бинарный снимок"""
+    schema_bytes = _check_schema(schema)
+    encoded = [_encode_record(schema, record) for record in records]
+
+    offsets = []
+    position = _HEADER.size + _OFFSET.size * len(encoded)
+    for data in encoded:
+        offsets.append(position)
+        position += len(data)
+
+    with open(filename, "wb") as fout:
+        fout.write(_HEADER.pack(magic, VERSION, schema_bytes, len(encoded)))
+        fout.write(b"".join(_OFFSET.pack(offset) for offset in offsets))
+        fout.writelines(encoded)
+
+
+class SnapshotView(Sequence[T], Generic[T]):
+    """Ленивое представление бинарного снимка поверх mmap.
+
+    Записи декодируются только при обращении к ним, поэтому открытие
+    снимка не зависит от числа записей в файле.
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        magic: bytes,
+        schema: str,
+        factory: Callable[..., T],
+    ) -> None:
+        self._schema = schema
+        self._factory = factory
+        with open(filename, "rb") as fin:
+            # Пустой файл mmap отображать отказывается, поэтому размер проверяется до
+            if os.fstat(fin.fileno()).st_size < _HEADER.size:
+                raise ValueError(f"{filename}: truncated snapshot")
+            self._mmap = mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_READ)
+
+        file_magic, version, file_schema, count = _HEADER.unpack_from(self._mmap, 0)
+        if file_magic != magic:
+            self.close()
+            raise ValueError(f"{filename}: unexpected snapshot magic {file_magic!r}")
+        if version != VERSION:
+            self.close()
+            raise ValueError(f"{filename}: unsupported snapshot version {version}")
+        if file_schema != _check_schema(schema):
+            self.close()
+            raise ValueError(f"{filename}: snapshot schema does not match {schema!r}")
+        self._count = count
+        if not self._fits():
+            self.close()
+            raise ValueError(f"{filename}: truncated snapshot")
+
+    def _fits(self) -> bool:
+        """Проверка, что таблица смещений и последняя запись умещаются в файле"""
+        size = len(self._mmap)
+        table_end = _HEADER.size + self._count * _OFFSET.size
+        if table_end > size:
+            return False
+        if self._count == 0:
+            return True
+        # Записи идут по возрастанию смещений, поэтому достаточно последней
+        (position,) = _OFFSET.unpack_from(self._mmap, table_end - _OFFSET.size)
+        for kind in self._schema:
+            if kind == "s":
+                if position + _LENGTH.size > size:
+                    return False
+                (length,) = _LENGTH.unpack_from(self._mmap, position)
+                position += _LENGTH.size + length
+            else:
+                position += _INT.size
+        return table_end <= position <= size
+
+    def _decode(self, index: int) -> T:
+        """Декодирование записи с заданным номером"""
+        (position,) = _OFFSET.unpack_from(
+            self._mmap, _HEADER.size + index * _OFFSET.size
+        )
+        values: List[Any] = []
+        for kind in self._schema:
+            if kind == "s":
+                (length,) = _LENGTH.unpack_from(self._mmap, position)
+                position += _LENGTH.size
+                values.append(
+                    self._mmap[position : position + length].decode("utf-8")
+                )
+                position += length
+            else:
+                (value,) = _INT.unpack_from(self._mmap, position)
+                position += _INT.size
+                values.append(value)
+        return self._factory(*values)
+
+    def __len__(self) -> int:
+        return self._count
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[T]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[T, List[T]]:
+        if isinstance(index, slice):
+            return [self._decode(i) for i in range(*index.indices(self._count))]
+        position = index + self._count if index < 0 else index
+        if not 0 <= position < self._count:
+            raise IndexError("snapshot index out of range")
+        return self._decode(position)
+
+    def __iter__(self) -> Iterator[T]:
+        # Записи лежат подряд, поэтому при полном проходе таблица смещений не нужна
+        data = self._mmap
+        factory = self._factory
+        schema = self._schema
+        unpack_length = _LENGTH.unpack_from
+        unpack_int = _INT.unpack_from
+        position = _HEADER.size + self._count * _OFFSET.size
+        for _ in range(self._count):
+            values: List[Any] = []
+            for kind in schema:
+                if kind == "s":
+                    (length,) = unpack_length(data, position)
+                    position += 4
+                    values.append(str(data[position : position + length], "utf-8"))
+                    position += length
+                else:
+                    (value,) = unpack_int(data, position)
+                    position += 8
+                    values.append(value)
+            yield factory(*values)
+
+    def close(self) -> None:
+        """Освобождение отображения файла в память"""
+        self._mmap.close()
+
+    def __enter__(self) -> "SnapshotView[T]":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
@@ -0,0 +1,100 @@
+import math
+import random
+from itertools import accumulate
+from typing import Iterable, Iterator, List, Tuple
+
+from task_package.zad1 import Track
+
+POSTS = [
+    "Инженер",
+    "Бухгалтер",
+    "Менеджер",
+    "Программист",
+    "Аналитик",
+    "Директор",
+    "Секретарь",
+    "Водитель",
+]
+SURNAMES = [
+    "Иванов",
+    "Петров",
+    "Сидоров",
+    "Смирнов",
+    "Кузнецов",
+    "Попов",
+    "Васильев",
+    "Соколов",
+    "Михайлов",
+    "Новиков",
+]
+INITIALS = "АБВГДЕЖЗИКЛМНОПРСТУФЭЮЯ"
+
+
+def zipf_weights(count: int, exponent: float = 1.1) -> List[float]:
+    """Накопленные веса распределения Ципфа для рангов 1..count"""
+    return list(accumulate(1.0 / rank**exponent for rank in range(1, count + 1)))
+
+
+def generate_tracks(
+    count: int, seed: int = 0, artists: int = 1000, exponent: float = 1.1
+) -> Iterator[Track]:
+    """Треки, исполнители которых распределены по закону Ципфа"""
+    rng = random.Random(seed)
+    cum_weights = zipf_weights(artists, exponent)
+    population = range(artists)
+    for i in range(count):
+        (artist,) = rng.choices(population, cum_weights=cum_weights)
+        duration = max(1, int(rng.lognormvariate(5.3, 0.4)))
+        yield Track(f"Track {i}", f"Artist {artist}", duration)
+
+
+def generate_workers(
+    count: int, seed: int = 0, first_year: int = 1970, last_year: int = 2025
+) -> Iterator[Tuple[str, str, int]]:
+    """Записи (ФИО, должность, год) с уникальными ФИО"""
+    rng = random.Random(seed)
+    width = len(str(count))
+    for i in range(count):
+        surname = rng.choice(SURNAMES)
+        initials = f"{rng.choice(INITIALS)}.{rng.choice(INITIALS)}."
+        name = f"{surname} {initials} #{i:0{width}d}"
+        yield name, rng.choice(POSTS), rng.randint(first_year, last_year)
+
+
+def generate_positions(count: int, seed: int = 0) -> Iterator[Tuple[str, float, float]]:
+    """Точки (название, долгота, широта), равномерно распределённые по сфере"""
+    rng = random.Random(seed)
+    for i in range(count):
+        lon = rng.uniform(-180.0, 180.0)
+        lat = math.degrees(math.asin(rng.uniform(-1.0, 1.0)))
+        yield f"P{i}", lon, lat
+
+
+def write_workers_xml(filename: str, records: Iterable[Tuple[str, str, int]]) -> None:
+    """Потоковая запись работников в XML того же вида, что и Staff.save"""
+    # saxutils подтягивает urllib.request и http.client, поэтому импорт отложен
+    from xml.sax.saxutils import escape
+
+    with open(filename, "w", encoding="utf8") as fout:
+        fout.write("<?xml version='1.0' encoding='utf8'?>\n<workers>")
+        for name, post, year in records:
+            fout.write(
+                f"<worker><name>{escape(name)}</name><post>{escape(post)}</post>"
+                f"<year>{year}</year></worker>"
+            )
+        fout.write("</workers>")
+
+
+def percentiles(
+    samples: List[float], points: Iterable[float] = (50, 90, 99)
+) -> List[Tuple[float, float]]:
+    """Перцентили выборки методом ближайшего ранга"""
+    ordered = sorted(samples)
+    result = []
+    for point in points:
+        if not ordered:
+            result.append((point, 0.0))
+            continue
+        rank = max(1, math.ceil(point / 100 * len(ordered)))
+        result.append((point, ordered[rank - 1]))
+    return result
@@ -0,0 +1,96 @@
+from itertools import islice
+from typing import (
+    Callable,
+    Hashable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    TypeVar,
+    Union,
+    overload,
+)
+
+T = TypeVar("T")
+
+
+class StaleViewError(RuntimeError):
+    """Контейнер изменился после создания представления"""
+
+
+class SequenceView(Sequence[T]):
+    """Представление только для чтения поверх хранилища контейнера без копирования.
+
+    Представление запоминает версию контейнера при создании и при каждом
+    обращении сверяет её с текущей: если контейнер изменился, возникает
+    StaleViewError. Срезы возвращают новые представления того же хранилища.
+    """
+
+    def __init__(
+        self,
+        source: Sequence[T],
+        version: Callable[[], Hashable],
+        indices: Optional[range] = None,
+    ) -> None:
+        self._source = source
+        self._version_of = version
+        self._version = version()
+        self._indices = range(len(source)) if indices is None else indices
+
+    def _check(self) -> None:
+        """Проверка, что контейнер не менялся"""
+        if self._version_of() != self._version:
+            raise StaleViewError("Container was modified after the view was created")
+
+    def __len__(self) -> int:
+        self._check()
+        return len(self._indices)
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "SequenceView[T]": ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[T, "SequenceView[T]"]:
+        self._check()
+        if isinstance(index, slice):
+            return SequenceView(self._source, self._version_of, self._indices[index])
+        return self._source[self._indices[index]]
+
+    def __iter__(self) -> Iterator[T]:
+        self._check()
+        indices = self._indices
+        if indices.step != 1:
+            for i in indices:
+                self._check()
+                yield self._source[i]
+            return
+
+        # Последовательный обход итератором хранилища: для deque это O(n),
+        # тогда как обращение по индексу в середину стоит O(n) на элемент
+        items = islice(iter(self._source), indices.start, indices.stop)
+        while True:
+            try:
+                item = next(items)
+            except StopIteration:
+                return
+            except RuntimeError:
+                # deque сам обнаруживает изменение; сообщаем об этом единообразно
+                self._check()
+                raise
+            self._check()
+            yield item
+
+    def to_list(self) -> List[T]:
+        """Явная копия элементов представления"""
+        return list(self)
+
+    def __eq__(self, other: object) -> bool:
+        # Представление равно списку или представлению с теми же элементами
+        if isinstance(other, (SequenceView, list)):
+            return self.to_list() == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"SequenceView({self.to_list()!r})"
@@ -1,5 +1,21 @@
-from dataclasses import dataclass, field
-from typing import List
+import zlib
+from dataclasses import dataclass, field, replace
+from itertools import chain
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+from task_package import instrumentation
+from task_package.instrumentation import Instrumentation
+from task_package.memory import sizeof
+from task_package.views import SequenceView
+
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+
+    from task_package.snapshot import SnapshotView
+
+SNAPSHOT_MAGIC = b"MCAT"
+SNAPSHOT_SCHEMA = "ssi"
 
 
 # 1. Датакласс для трека
@@ -17,25 +33,357 @@ class Track:
         return f"{minutes}:{seconds:02d}"
 
 
+# Сводная статистика по трекам одного исполнителя
+@dataclass
+class ArtistStats:
+    artist: str
+    count: int = 0
+    total_sec: int = 0
+    min_sec: int = 0
+    max_sec: int = 0
+
+    def add(self, duration_sec: int) -> None:
+        """Учёт ещё одного трека"""
+        if self.count == 0 or duration_sec < self.min_sec:
+            self.min_sec = duration_sec
+        if self.count == 0 or duration_sec > self.max_sec:
+            self.max_sec = duration_sec
+        self.count += 1
+        self.total_sec += duration_sec
+
+
 # 2. Контейнер для хранения треков
 @dataclass
 class MusicCatalog:
+    """Каталог треков со статистикой, обновляемой при каждом add_track.
+
+    Статистика учитывает только треки, добавленные через конструктор или
+    add_track; прямые изменения списка tracks в неё не попадают.
+    """
+
     tracks: List[Track] = field(default_factory=list)
+    metrics: Optional[Instrumentation] = field(
+        default_factory=instrumentation.current, compare=False, repr=False
+    )
+    # Ширина корзины гистограммы длительностей в секундах
+    histogram_bucket_sec: int = field(default=60, compare=False, repr=False)
+    _artist_stats: Dict[str, ArtistStats] = field(
+        default_factory=dict, init=False, compare=False, repr=False
+    )
+    _histogram: Dict[int, int] = field(
+        default_factory=dict, init=False, compare=False, repr=False
+    )
+    _total_sec: int = field(default=0, init=False, compare=False, repr=False)
+    _version: int = field(default=0, init=False, compare=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Расчёт статистики по начальным трекам"""
+        if self.histogram_bucket_sec <= 0:
+            raise ValueError("Histogram bucket must be positive")
+        for track in self.tracks:
+            self._account(track)
+
+    def _account(self, track: Track) -> None:
+        """Учёт трека в статистике"""
+        key = track.artist.lower()
+        stats = self._artist_stats.get(key)
+        if stats is None:
+            stats = self._artist_stats[key] = ArtistStats(track.artist)
+        stats.add(track.duration_sec)
+
+        bucket = track.duration_sec // self.histogram_bucket_sec
+        self._histogram[bucket] = self._histogram.get(bucket, 0) + 1
+        self._total_sec += track.duration_sec
 
     def add_track(self, track: Track) -> None:
         """Добавление трека в каталог"""
+        if self.metrics is not None:
+            self.metrics.incr("music_catalog.add_track")
         self.tracks.append(track)
+        self._account(track)
+        self._version += 1
+
+    def _current_version(self) -> Tuple[int, int]:
+        # Длина учитывает и прямые изменения списка tracks
+        return self._version, len(self.tracks)
+
+    def tracks_view(self) -> SequenceView[Track]:
+        """Представление треков только для чтения без копирования списка"""
+        return SequenceView(self.tracks, self._current_version)
+
+    @property
+    def total_duration_sec(self) -> int:
+        """Суммарная длительность всех треков"""
+        return self._total_sec
+
+    def artist_stats(self, artist: str) -> Optional[ArtistStats]:
+        """Статистика исполнителя (без учёта регистра) или None"""
+        stats = self._artist_stats.get(artist.lower())
+        return replace(stats) if stats is not None else None
+
+    def all_artist_stats(self) -> List[ArtistStats]:
+        """Статистика всех исполнителей в порядке первого появления"""
+        return [replace(stats) for stats in self._artist_stats.values()]
+
+    def duration_histogram(self) -> Dict[int, int]:
+        """Число треков по корзинам: начало корзины в секундах -> количество"""
+        width = self.histogram_bucket_sec
+        return {
+            bucket * width: count for bucket, count in sorted(self._histogram.items())
+        }
+
+    def memory_usage(self, deep: bool = True) -> int:
+        """Занимаемая каталогом память в байтах (общие строки учитываются один раз)"""
+        return sizeof(self, deep, exclude=("metrics",))
+
+    def intern_strings(self) -> int:
+        """Замена повторяющихся имён исполнителей одной общей строкой"""
+        pool: Dict[str, str] = {}
+        shared = 0
+        for track in self.tracks:
+            artist = pool.setdefault(track.artist, track.artist)
+            if artist is not track.artist:
+                track.artist = artist
+                shared += 1
+        for stats in self._artist_stats.values():
+            stats.artist = pool.setdefault(stats.artist, stats.artist)
+        return shared
 
     def get_tracks_shorter_than(self, max_minutes: int) -> List[Track]:
         """Получение треков короче указанного количества минут"""
+        start = perf_counter() if self.metrics is not None else 0.0
         max_seconds = max_minutes * 60
-        return [track for track in self.tracks if track.duration_sec < max_seconds]
+        result = [track for track in self.tracks if track.duration_sec < max_seconds]
+        if self.metrics is not None:
+            self.metrics.observe(
+                "music_catalog.get_tracks_shorter_than", perf_counter() - start
+            )
+        return result
 
     def get_tracks_by_artist(self, artist: str) -> List[Track]:
         """Получение треков конкретного исполнителя"""
-        return [
+        start = perf_counter() if self.metrics is not None else 0.0
+        result = [
             track for track in self.tracks if track.artist.lower() == artist.lower()
         ]
+        if self.metrics is not None:
+            self.metrics.observe(
+                "music_catalog.get_tracks_by_artist", perf_counter() - start
+            )
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        """Снимок метрик каталога (пустой, если сбор метрик отключён)"""
+        return self.metrics.snapshot() if self.metrics is not None else {}
+
+    def save_snapshot(self, filename: str) -> None:
+        """Сохранение каталога в бинарный снимок"""
+        from task_package.snapshot import write_snapshot
+
+        write_snapshot(
+            filename,
+            SNAPSHOT_MAGIC,
+            SNAPSHOT_SCHEMA,
+            ((track.title, track.artist, track.duration_sec) for track in self.tracks),
+        )
+
+    @staticmethod
+    def open_snapshot(filename: str) -> "SnapshotView[Track]":
+        """Ленивое открытие бинарного снимка без декодирования треков"""
+        from task_package.snapshot import SnapshotView
+
+        return SnapshotView(filename, SNAPSHOT_MAGIC, SNAPSHOT_SCHEMA, Track)
+
+    @classmethod
+    def load_snapshot(cls, filename: str) -> "MusicCatalog":
+        """Загрузка каталога из бинарного снимка"""
+        with cls.open_snapshot(filename) as snapshot:
+            return cls(tracks=list(snapshot))
+
+
+# Столбцы шарда в порядке добавления: номера треков в каталоге, названия,
+# исполнители, длительности. Запросы читают только нужные им столбцы
+ShardColumns = Tuple[List[int], List[str], List[str], List[int]]
+ShardQuery = Callable[..., Any]
+
+# Число строк, добавленных в шард после запуска пула, при котором пул
+# перезапускается со свежей копией вместо пересылки хвоста с каждым запросом
+REBASE_ROWS = 4096
+
+# Строки всех шардов в процессе-исполнителе (заполняются инициализатором пула)
+_worker_shards: List[ShardColumns] = []
+
+
+def _init_shard_worker(shards: List[ShardColumns]) -> None:
+    """Загрузка копии шардов в процесс-исполнитель"""
+    global _worker_shards
+    _worker_shards = shards
+
+
+def _run_shard_query(
+    index: int,
+    base: int,
+    tail: ShardColumns,
+    query: ShardQuery,
+    args: Tuple[Any, ...],
+) -> Any:
+    """Выполнение запроса над шардом процесса-исполнителя.
+
+    tail - строки, добавленные в шард после строки base; копия в процессе
+    дополняется недостающими из них.
+    """
+    columns = _worker_shards[index]
+    missing = base + len(tail[0]) - len(columns[0])
+    if missing > 0:
+        start = len(tail[0]) - missing
+        columns[0].extend(tail[0][start:])
+        columns[1].extend(tail[1][start:])
+        columns[2].extend(tail[2][start:])
+        columns[3].extend(tail[3][start:])
+    return query(columns, *args)
+
+
+def shorter_than_query(columns: ShardColumns, max_seconds: int) -> List[int]:
+    """Номера треков шарда короче max_seconds"""
+    sequences, _, _, durations = columns
+    return [
+        sequence
+        for sequence, duration in zip(sequences, durations)
+        if duration < max_seconds
+    ]
+
+
+def shard_of(artist: str, shard_count: int) -> int:
+    """Номер шарда исполнителя (стабилен между процессами, в отличие от hash)"""
+    return zlib.crc32(artist.lower().encode("utf-8")) % shard_count
+
+
+# Каталог, разделённый по исполнителям на шарды с параллельными запросами
+@dataclass
+class ShardedMusicCatalog:
+    shard_count: int = 4
+    # Число процессов; 0 - выполнять запросы к шардам в текущем процессе
+    max_workers: Optional[int] = None
+    shards: List[MusicCatalog] = field(init=False, repr=False)
+    # Все треки в порядке добавления; запросы к шардам возвращают номера в нём
+    _tracks: List[Track] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    _columns: List[ShardColumns] = field(init=False, repr=False, compare=False)
+    # Длины шардов на момент запуска пула: строки после них пересылаются
+    # процессам вместе с запросами
+    _base: List[int] = field(init=False, repr=False, compare=False)
+    _executor: Optional["ProcessPoolExecutor"] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Создание пустых шардов"""
+        if self.shard_count <= 0:
+            raise ValueError("Shard count must be positive")
+        self.shards = [MusicCatalog() for _ in range(self.shard_count)]
+        self._columns = [([], [], [], []) for _ in range(self.shard_count)]
+        self._base = [0] * self.shard_count
+
+    def add_track(self, track: Track) -> None:
+        """Добавление трека в шард его исполнителя"""
+        index = shard_of(track.artist, self.shard_count)
+        self.shards[index].add_track(track)
+        sequences, titles, artists, durations = self._columns[index]
+        sequences.append(len(self._tracks))
+        titles.append(track.title)
+        artists.append(track.artist)
+        durations.append(track.duration_sec)
+        self._tracks.append(track)
+
+    @property
+    def tracks(self) -> List[Track]:
+        """Все треки в порядке добавления"""
+        return list(self._tracks)
+
+    def __len__(self) -> int:
+        return len(self._tracks)
+
+    def _collect(self, found: List[List[int]]) -> List[Track]:
+        """Треки по номерам, найденным в шардах, в порядке добавления"""
+        # Номера каждого шарда уже упорядочены, и sorted сливает эти серии
+        return list(map(self._tracks.__getitem__, sorted(chain.from_iterable(found))))
+
+    def _pool(self) -> "ProcessPoolExecutor":
+        """Пул процессов с копией шардов"""
+        stale = any(
+            len(columns[0]) - base > REBASE_ROWS
+            for columns, base in zip(self._columns, self._base)
+        )
+        if self._executor is not None and stale:
+            # Старые процессы завершатся в фоне, не задерживая запрос
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        if self._executor is None:
+            from concurrent.futures import ProcessPoolExecutor
+
+            self._base = [len(columns[0]) for columns in self._columns]
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_init_shard_worker,
+                initargs=(self._columns,),
+            )
+        return self._executor
+
+    def map_shards(self, query: ShardQuery, *args: Any) -> List[Any]:
+        """Выполнение запроса query(столбцы_шарда, *args) над всеми шардами.
+
+        query должна быть функцией уровня модуля, чтобы её можно было
+        передать в процесс-исполнитель; см. ShardColumns.
+        """
+        if self.max_workers == 0:
+            return [query(columns, *args) for columns in self._columns]
+        pool = self._pool()
+        futures = []
+        for index, (columns, base) in enumerate(zip(self._columns, self._base)):
+            sequences, titles, artists, durations = columns
+            tail = (sequences[base:], titles[base:], artists[base:], durations[base:])
+            futures.append(
+                pool.submit(_run_shard_query, index, base, tail, query, args)
+            )
+        return [future.result() for future in futures]
+
+    def get_tracks_shorter_than(self, max_minutes: int) -> List[Track]:
+        """Получение треков короче указанного количества минут"""
+        return self._collect(self.map_shards(shorter_than_query, max_minutes * 60))
+
+    def get_tracks_by_artist(self, artist: str) -> List[Track]:
+        """Получение треков исполнителя: запрос затрагивает один шард"""
+        shard = self.shards[shard_of(artist, self.shard_count)]
+        return shard.get_tracks_by_artist(artist)
+
+    def artist_stats(self, artist: str) -> Optional[ArtistStats]:
+        """Статистика исполнителя из его шарда"""
+        return self.shards[shard_of(artist, self.shard_count)].artist_stats(artist)
+
+    def duration_histogram(self) -> Dict[int, int]:
+        """Гистограмма длительностей, объединённая по шардам"""
+        result: Dict[int, int] = {}
+        for shard in self.shards:
+            for start, count in shard.duration_histogram().items():
+                result[start] = result.get(start, 0) + count
+        return dict(sorted(result.items()))
+
+    def _shutdown(self) -> None:
+        """Остановка пула процессов"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def close(self) -> None:
+        """Освобождение ресурсов каталога"""
+        self._shutdown()
+
+    def __enter__(self) -> "ShardedMusicCatalog":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
 
 # 3. Демонстрация работы
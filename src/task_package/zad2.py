@@ -1,6 +1,11 @@
 from collections import deque
 from dataclasses import dataclass, field
-from typing import Generic, List, Optional, TypeVar
+from typing import Any, Callable, Dict, Generic, Iterator, List, Optional, TypeVar, cast
+
+from task_package import instrumentation
+from task_package.instrumentation import Instrumentation
+from task_package.memory import sizeof
+from task_package.views import SequenceView
 
 T = TypeVar("T")
 
@@ -12,25 +17,113 @@ class RingBuffer(Generic[T]):
     capacity: int = field(default=10)
     buffer: deque[T] = field(default_factory=deque, init=False, repr=False)
     _size: int = field(default=0, init=False, compare=False, repr=False)
+    # Счётчик изменений для проверки представлений и итераторов
+    _version: int = field(default=0, init=False, compare=False, repr=False)
+    metrics: Optional[Instrumentation] = field(
+        default_factory=instrumentation.current, compare=False, repr=False
+    )
+    # Вызывается для каждого элемента, вытесненного при переполнении
+    on_evict: Optional[Callable[[T], None]] = field(
+        default=None, compare=False, repr=False
+    )
+    # Получает вытесненные элементы пачками по spill_batch_size
+    spill_sink: Optional[Callable[[List[T]], None]] = field(
+        default=None, compare=False, repr=False
+    )
+    spill_batch_size: int = field(default=64, compare=False, repr=False)
+    _spill: List[T] = field(default_factory=list, init=False, compare=False, repr=False)
+    # Задан ли хотя бы один из metrics, on_evict и spill_sink; вычисляется при
+    # создании, чтобы push без них обходился одной проверкой
+    _hooks: bool = field(default=False, init=False, compare=False, repr=False)
 
     def __post_init__(self) -> None:
         """Инициализация внутреннего буфера заданной емкости"""
         if self.capacity <= 0:
             raise ValueError("Capacity must be positive")
+        if self.spill_batch_size <= 0:
+            raise ValueError("Batch size must be positive")
         self.buffer = deque(maxlen=self.capacity)
+        self._hooks = (
+            self.metrics is not None
+            or self.on_evict is not None
+            or self.spill_sink is not None
+        )
 
     def push(self, item: T) -> None:
         """Добавление элемента в буфер (заменяет самый старый при переполнении)"""
-        self.buffer.append(item)
-        self._size = len(self.buffer)
+        buffer = self.buffer
+        if self._hooks:
+            full = len(buffer) == self.capacity
+            if self.metrics is not None:
+                self.metrics.incr("ring_buffer.push")
+                if full:
+                    self.metrics.incr("ring_buffer.overwrite")
+            if full and (self.on_evict is not None or self.spill_sink is not None):
+                self._evict(buffer[0])
+        buffer.append(item)
+        self._size = len(buffer)
+        self._version += 1
 
     def pop(self) -> Optional[T]:
         """Извлечение самого старого элемента из буфера"""
         if self.is_empty():
+            if self.metrics is not None:
+                self.metrics.incr("ring_buffer.pop_empty")
             return None
+        if self.metrics is not None:
+            self.metrics.incr("ring_buffer.pop")
         self._size -= 1
+        self._version += 1
         return self.buffer.popleft()
 
+    def _evict(self, item: T) -> None:
+        """Передача вытесняемого элемента обработчику и в очередь выгрузки"""
+        if self.on_evict is not None:
+            self.on_evict(item)
+        if self.spill_sink is not None:
+            self._spill.append(item)
+            if len(self._spill) >= self.spill_batch_size:
+                self.flush()
+
+    def flush(self) -> int:
+        """Выгрузка накопленных вытесненных элементов в spill_sink"""
+        if not self._spill or self.spill_sink is None:
+            return 0
+        batch, self._spill = self._spill, []
+        if self.metrics is not None:
+            self.metrics.incr("ring_buffer.spill", len(batch))
+        self.spill_sink(batch)
+        return len(batch)
+
+    def drain_to(self, sink: Callable[[List[T]], None], batch_size: int = 64) -> int:
+        """Извлечение всех элементов в sink пачками от старого к новому"""
+        if batch_size <= 0:
+            raise ValueError("Batch size must be positive")
+        # Сначала выгружаются уже вытесненные элементы: они старше оставшихся
+        self.flush()
+        buffer = self.buffer
+        if not buffer:
+            return 0
+        # Буфер забирается одной копией и режется срезами без поэлементных pop
+        items = list(buffer)
+        buffer.clear()
+        self._size = 0
+        self._version += 1
+        drained = 0
+        try:
+            for start in range(0, len(items), batch_size):
+                batch = items[start : start + batch_size]
+                sink(batch)
+                drained += len(batch)
+        finally:
+            # Если sink упал, непереданные элементы возвращаются в буфер
+            if drained < len(items):
+                buffer.extend(items[drained:])
+                self._size = len(buffer)
+            if self.metrics is not None:
+                self.metrics.incr("ring_buffer.drain", drained)
+        return drained
+
     def peek(self) -> Optional[T]:
         """Просмотр самого старого элемента без извлечения"""
         if self.is_empty():
@@ -46,24 +139,67 @@ class RingBuffer(Generic[T]):
         return len(self.buffer) == self.capacity
 
     def clear(self) -> None:
-        """Очистка буфера"""
+        """Очистка буфера; элементы отбрасываются мимо on_evict и spill_sink"""
+        if self.metrics is not None:
+            self.metrics.incr("ring_buffer.clear")
+            self.metrics.incr("ring_buffer.discard", len(self.buffer))
         self.buffer.clear()
         self._size = 0
+        self._version += 1
 
     def get_all(self) -> List[T]:
         """Получение всех элементов буфера в порядке добавления"""
         return list(self.buffer)
 
+    def view(self) -> SequenceView[T]:
+        """Представление элементов без копирования (недействительно после изменения)"""
+        return SequenceView(self.buffer, self._current_version)
+
+    def _current_version(self) -> int:
+        return self._version
+
+    def memory_usage(self, deep: bool = True) -> int:
+        """Занимаемая буфером память в байтах, включая ещё не выгруженные элементы"""
+        return sizeof(
+            self, deep, exclude=("metrics", "on_evict", "spill_sink", "_hooks")
+        )
+
+    def intern_strings(self) -> int:
+        """Замена повторяющихся строковых элементов одной общей строкой"""
+        pool: Dict[str, str] = {}
+        shared = 0
+        buffer = self.buffer
+        # Поворот на полный круг сохраняет порядок и сам объект deque
+        for _ in range(len(buffer)):
+            item = buffer.popleft()
+            if isinstance(item, str):
+                value = pool.setdefault(item, item)
+                if value is not item:
+                    item = cast(T, value)
+                    shared += 1
+            buffer.append(item)
+        self._version += 1
+        return shared
+
+    def stats(self) -> Dict[str, Any]:
+        """Снимок метрик буфера (пустой, если сбор метрик отключён)"""
+        return self.metrics.snapshot() if self.metrics is not None else {}
+
     def __len__(self) -> int:
         """Текущее количество элементов в буфере"""
         return len(self.buffer)
 
+    def __iter__(self) -> Iterator[T]:
+        """Обход элементов от старого к новому без копирования"""
+        return iter(self.view())
+
     def __contains__(self, item: T) -> bool:
         """Проверка наличия элемента в буфере"""
         return item in self.buffer
 
     def __str__(self) -> str:
-        return f"RingBuffer(capacity={self.capacity}, size={len(self.buffer)}, items={list(self.buffer)})"
+        items = ", ".join(map(repr, self.buffer))
+        return f"RingBuffer(capacity={self.capacity}, size={len(self.buffer)}, items=[{items}])"
 
 
 # Демонстрация работы кольцевого буфера
@@ -0,0 +1,167 @@
+import os
+import random
+import sys
+from itertools import permutations
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "examples"))
+from examples1 import (  # noqa: E402
+    CHORD2,
+    EQUIRECTANGULAR,
+    Position,
+    Route,
+    chord2_to_km,
+    km_to_chord2,
+    within_radius,
+)
+
+
+def random_points(count: int, seed: int = 0) -> list:
+    """Случайные точки в пределах небольшого региона"""
+    rng = random.Random(seed)
+    return [
+        Position(f"P{i}", rng.uniform(30, 40), rng.uniform(50, 60))
+        for i in range(count)
+    ]
+
+
+def brute_length(stops: list) -> float:
+    """Длина маршрута без кеша"""
+    return sum(a.distance_to(b) for a, b in zip(stops, stops[1:]))
+
+
+class TestRoute:
+    """Тесты для маршрута с кешем расстояний"""
+
+    def test_distance_to(self) -> None:
+        """Проверка расстояния Москва - Санкт-Петербург"""
+        moscow = Position("Москва", 37.6173, 55.7558)
+        spb = Position("Санкт-Петербург", 30.3351, 59.9343)
+        assert moscow.distance_to(spb) == pytest.approx(634, abs=1)
+
+    def test_cumulative_lengths(self) -> None:
+        """Проверка накопленных длин"""
+        points = random_points(5)
+        route = Route(points)
+
+        cumulative = route.cumulative_lengths()
+        assert cumulative[0] == 0.0
+        assert cumulative[-1] == pytest.approx(brute_length(points))
+        assert route.total_length == cumulative[-1]
+
+    def test_incremental_insert_remove_move(self) -> None:
+        """Проверка пересчёта длин при вставке, удалении и перемещении"""
+        route = Route()
+        for point in random_points(6):
+            route.append(point)
+        extra = Position("X", 35, 55)
+
+        for index in (0, 3, len(route.stops)):
+            route.insert(index, extra)
+            assert route.total_length == pytest.approx(brute_length(route.stops))
+            assert route.remove(index) is extra
+            assert route.total_length == pytest.approx(brute_length(route.stops))
+
+        route.move(0, 4)
+        route.move(5, 1)
+        assert route.cumulative_lengths() == pytest.approx(
+            Route(list(route.stops)).cumulative_lengths()
+        )
+
+    def test_optimize_short_closed_route(self) -> None:
+        """Проверка длины замкнутого маршрута из двух точек"""
+        moscow = Position("Москва", 37.6173, 55.7558)
+        spb = Position("Санкт-Петербург", 30.3351, 59.9343)
+        route = Route([moscow, spb])
+
+        assert route.optimize(closed=True) == pytest.approx(2 * route.total_length)
+        assert route.optimize() == pytest.approx(route.total_length)
+        assert Route([moscow]).optimize(closed=True) == 0.0
+
+    def test_distances_are_cached(self) -> None:
+        """Проверка, что пары расстояний не пересчитываются"""
+        points = random_points(4)
+        route = Route(points)
+        calls = []
+        original = Position.distance_to
+
+        def counting(self, other):
+            calls.append((self.name, other.name))
+            return original(self, other)
+
+        Position.distance_to = counting  # type: ignore
+        try:
+            route.length_of([3, 2, 1, 0])
+            route.length_of([0, 1, 2, 3])
+        finally:
+            Position.distance_to = original  # type: ignore
+        assert calls == []
+
+    def test_optimize_small_matches_brute_force(self) -> None:
+        """Проверка эвристики на маленьком наборе против перебора"""
+        points = random_points(7, seed=3)
+        route = Route(list(points))
+        best = min(
+            brute_length([points[0], *rest]) for rest in permutations(points[1:])
+        )
+
+        length = route.optimize()
+        assert length == pytest.approx(route.total_length)
+        assert length <= best * 1.1
+        assert route.stops[0] is points[0]
+        assert sorted(p.name for p in route.stops) == sorted(p.name for p in points)
+
+    def test_optimize_closed_improves(self) -> None:
+        """Проверка, что замкнутый маршрут становится короче"""
+        points = random_points(200, seed=5)
+        route = Route(list(points))
+        before = route.length_of(list(range(200)), closed=True)
+
+        assert route.optimize(closed=True) < before / 3
+
+
+class TestDistanceModes:
+    """Тесты для приближённых режимов расстояния"""
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_equirectangular_error_bound(self, seed: int) -> None:
+        """Проверка погрешности на расстояниях до 1000 км"""
+        for a, b in zip(random_points(50, seed), random_points(50, seed + 100)):
+            exact = a.distance_to(b)
+            approx = a.distance_to(b, mode=EQUIRECTANGULAR)
+            assert approx == pytest.approx(exact, rel=0.01)
+
+    def test_equirectangular_antimeridian(self) -> None:
+        """Проверка перехода через 180-й меридиан"""
+        a = Position("A", 179.5, 10)
+        b = Position("B", -179.5, 10)
+        assert a.equirectangular_to(b) == pytest.approx(a.distance_to(b), rel=1e-4)
+
+    def test_chord2_is_exact_after_conversion(self) -> None:
+        """Проверка, что хорда переводится в точное расстояние"""
+        for a, b in zip(random_points(20, 1), random_points(20, 2)):
+            assert chord2_to_km(a.distance_to(b, mode=CHORD2)) == pytest.approx(
+                a.distance_to(b)
+            )
+
+    def test_chord2_cache_follows_coordinates(self) -> None:
+        """Проверка пересчёта единичного вектора при смене координат"""
+        a = Position("A", 0, 0)
+        b = Position("B", 0, 0)
+        assert a.chord2_to(b) == 0
+        b.lat = 90
+        assert chord2_to_km(a.chord2_to(b)) == pytest.approx(a.distance_to(b))
+
+    def test_within_radius(self) -> None:
+        """Проверка точного фильтра по радиусу"""
+        origin = Position("O", 35, 55)
+        points = random_points(300, 7)
+        expected = [p for p in points if origin.distance_to(p) <= 300]
+        assert within_radius(origin, points, 300) == expected
+        assert km_to_chord2(10**9) == pytest.approx(4)
+
+    def test_unknown_mode(self) -> None:
+        """Проверка неизвестного режима"""
+        with pytest.raises(ValueError, match="Unknown distance mode"):
+            Position("A").distance_to(Position("B"), mode="manhattan")
@@ -0,0 +1,548 @@
+import io
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "examples"))
+from examples2 import SqliteStaff, Staff, Worker, run_batch  # noqa: E402
+from task_package.synthetic import write_workers_xml  # noqa: E402
+from task_package.views import StaleViewError  # noqa: E402
+
+
+def make_staff() -> Staff:
+    """Создание штата с тестовыми работниками"""
+    staff = Staff()
+    staff.add("Петров П.П.", "Инженер", 2010)
+    staff.add("Иванов И.И.", "Директор", 2001)
+    staff.add("Сидоров С.С.", "Инженер", 2020)
+    return staff
+
+
+class TestStaffPersistence:
+    """Тесты для сохранения и загрузки штата"""
+
+    def test_xml_roundtrip(self, tmp_path) -> None:
+        """Проверка сохранения и загрузки XML"""
+        filename = str(tmp_path / "staff.xml")
+        staff = make_staff()
+        staff.save(filename)
+
+        loaded = Staff()
+        loaded.load(filename)
+        assert loaded.workers == staff.workers
+
+    def test_snapshot_roundtrip(self, tmp_path) -> None:
+        """Проверка сохранения и загрузки бинарного снимка"""
+        filename = str(tmp_path / "staff.bin")
+        staff = make_staff()
+        staff.save_snapshot(filename)
+
+        loaded = Staff()
+        loaded.load_snapshot(filename)
+        assert loaded.workers == staff.workers
+
+        with Staff.open_snapshot(filename) as snapshot:
+            assert snapshot[0] == Worker("Иванов И.И.", "Директор", 2001)
+
+
+class TestStaffParallelLoad:
+    """Тесты для параллельной загрузки XML"""
+
+    def test_load_parallel_matches_load(self, tmp_path) -> None:
+        """Проверка совпадения результата с последовательной загрузкой"""
+        filename = str(tmp_path / "staff.xml")
+        staff = Staff(
+            workers=[
+                Worker(f"Работник {i:03d}", "Инженер", 2000 + i % 20)
+                for i in range(100)
+            ]
+        )
+        write_workers_xml(
+            filename, ((w.name, w.post, w.year) for w in reversed(staff.workers))
+        )
+
+        for max_workers in (1, 3):
+            loaded = Staff()
+            loaded.load_parallel(filename, max_workers=max_workers)
+            assert loaded.workers == sorted(staff.workers, key=lambda w: w.name)
+
+    def test_load_parallel_empty_file(self, tmp_path) -> None:
+        """Проверка параллельной загрузки пустого списка работников"""
+        filename = str(tmp_path / "empty.xml")
+        Staff().save(filename)
+
+        loaded = make_staff()
+        loaded.load_parallel(filename, max_workers=2)
+        assert loaded.workers == []
+
+    def test_load_parallel_worker_attributes(self, tmp_path) -> None:
+        """Проверка элементов worker с атрибутами"""
+        filename = tmp_path / "attrs.xml"
+        filename.write_text(
+            "<?xml version='1.0' encoding='utf8'?>\n<workers>"
+            + "".join(
+                f'<worker id="{i}"><name>Работник {i}</name><post>Инженер</post>'
+                f"<year>{2000 + i}</year></worker>"
+                for i in range(10)
+            )
+            + "</workers>",
+            encoding="utf8",
+        )
+
+        expected = Staff()
+        expected.load(str(filename))
+        assert len(expected.workers) == 10
+        for max_workers in (1, 3):
+            loaded = make_staff()
+            loaded.load_parallel(str(filename), max_workers=max_workers)
+            assert loaded.workers == expected.workers
+
+    def test_load_parallel_comment(self, tmp_path) -> None:
+        """Проверка документа, в комментарии которого встречается <worker>"""
+        filename = tmp_path / "comment.xml"
+        filename.write_text(
+            "<?xml version='1.0' encoding='utf8'?>\n<workers>"
+            "<!-- <worker> удалён -->"
+            "<worker><name>А</name><post>Инженер</post><year>2000</year></worker>"
+            "<!-- <worker> -->"
+            "<worker><name>Б</name><post>Директор</post><year>2001</year></worker>"
+            "</workers>",
+            encoding="utf8",
+        )
+
+        loaded = Staff()
+        loaded.load_parallel(str(filename), max_workers=2)
+        assert [w.name for w in loaded.workers] == ["А", "Б"]
+
+
+class TestStaffJournal:
+    """Тесты для журнала добавлений"""
+
+    def test_incremental_save_appends_journal(self, tmp_path) -> None:
+        """Проверка, что повторное сохранение дописывает журнал"""
+        filename = str(tmp_path / "staff.xml")
+        staff = make_staff()
+        staff.save(filename)
+        base = (tmp_path / "staff.xml").read_bytes()
+
+        staff.add("Алексеев А.А.", "Бухгалтер", 2015)
+        staff.save(filename)
+
+        assert (tmp_path / "staff.xml").read_bytes() == base
+        assert (tmp_path / "staff.xml.journal").exists()
+
+        loaded = Staff()
+        loaded.load(filename)
+        assert loaded.workers == staff.workers
+
+    def test_compaction_by_threshold(self, tmp_path) -> None:
+        """Проверка сжатия журнала при достижении порога"""
+        filename = str(tmp_path / "staff.xml")
+        staff = make_staff()
+        staff.compact_threshold = 2
+        staff.save(filename)
+
+        staff.add("Алексеев А.А.", "Бухгалтер", 2015)
+        staff.save(filename)
+        assert (tmp_path / "staff.xml.journal").exists()
+
+        staff.add("Борисов Б.Б.", "Инженер", 2018)
+        staff.save(filename)
+        assert not (tmp_path / "staff.xml.journal").exists()
+
+        loaded = Staff()
+        loaded.load(filename)
+        assert loaded.workers == staff.workers
+
+    def test_save_to_other_file_rewrites(self, tmp_path) -> None:
+        """Проверка полной записи при сохранении в другой файл"""
+        first = str(tmp_path / "first.xml")
+        second = str(tmp_path / "second.xml")
+        staff = make_staff()
+        staff.save(first)
+        staff.add("Алексеев А.А.", "Бухгалтер", 2015)
+        staff.save(second)
+
+        assert not (tmp_path / "second.xml.journal").exists()
+        loaded = Staff()
+        loaded.load(second)
+        assert loaded.workers == staff.workers
+
+    def test_load_replays_journal_after_reload(self, tmp_path) -> None:
+        """Проверка продолжения журнала после повторной загрузки"""
+        filename = str(tmp_path / "staff.xml")
+        make_staff().save(filename)
+
+        staff = Staff()
+        staff.load(filename)
+        staff.add("Алексеев А.А.", "Бухгалтер", 2015)
+        staff.save(filename)
+
+        again = Staff()
+        again.load_parallel(filename, max_workers=1)
+        again.add("Борисов Б.Б.", "Инженер", 2018)
+        again.save(filename)
+
+        loaded = Staff()
+        loaded.load(filename)
+        assert len(loaded.workers) == 5
+        assert loaded.workers == again.workers
+
+
+class TestSqliteStaff:
+    """Тесты для хранилища SQLite"""
+
+    def test_add_and_order(self) -> None:
+        """Проверка добавления и порядка работников"""
+        with SqliteStaff() as staff:
+            staff.add("Петров П.П.", "Инженер", 2010)
+            staff.add("Иванов И.И.", "Директор", 2001)
+
+            assert len(staff) == 2
+            assert staff.workers == make_staff().workers[:2]
+
+    def test_select_matches_staff(self) -> None:
+        """Проверка совпадения выборки с Staff"""
+        with SqliteStaff(batch_size=2) as staff:
+            staff.add_many(make_staff().workers)
+
+            for period in (0, 5, 15, 30):
+                assert staff.select(period) == make_staff().select(period)
+
+    def test_xml_roundtrip(self, tmp_path) -> None:
+        """Проверка обмена XML-файлами со Staff"""
+        source = str(tmp_path / "source.xml")
+        target = str(tmp_path / "target.xml")
+        make_staff().save(source)
+
+        with SqliteStaff(str(tmp_path / "staff.db")) as staff:
+            staff.load(source)
+            staff.load(source)
+            assert len(staff) == 3
+            staff.save(target)
+
+        loaded = Staff()
+        loaded.load(target)
+        assert loaded.workers == make_staff().workers
+
+    def test_journal_shared_with_staff(self, tmp_path) -> None:
+        """Проверка учёта журнала Staff при загрузке и сохранении"""
+        filename = str(tmp_path / "staff.xml")
+        staff = make_staff()
+        staff.save(filename)
+        staff.add("Алексеев А.А.", "Бухгалтер", 2015)
+        staff.save(filename)
+        assert (tmp_path / "staff.xml.journal").exists()
+
+        with SqliteStaff() as database:
+            database.load(filename)
+            assert database.workers == staff.workers
+            database.remove("Алексеев А.А.")
+            database.save(filename)
+
+        assert not (tmp_path / "staff.xml.journal").exists()
+        loaded = Staff()
+        loaded.load(filename)
+        assert loaded.workers == make_staff().workers
+
+    def test_persistence_between_connections(self, tmp_path) -> None:
+        """Проверка сохранения данных в файле базы"""
+        database = str(tmp_path / "staff.db")
+        with SqliteStaff(database) as staff:
+            staff.add("Иванов И.И.", "Директор", 2001)
+
+        with SqliteStaff(database) as staff:
+            assert staff.workers == [Worker("Иванов И.И.", "Директор", 2001)]
+
+    def test_snapshot_roundtrip(self, tmp_path) -> None:
+        """Проверка обмена бинарными снимками со Staff"""
+        filename = str(tmp_path / "staff.bin")
+        make_staff().save_snapshot(filename)
+
+        with SqliteStaff() as staff:
+            staff.load_snapshot(filename)
+            assert staff.workers == make_staff().workers
+            assert str(staff) == str(make_staff())
+
+
+class TestStaffIndex:
+    """Тесты для индекса работников по ФИО"""
+
+    def test_get(self) -> None:
+        """Проверка поиска работника по ФИО"""
+        staff = make_staff()
+        assert staff.get("Иванов И.И.") == Worker("Иванов И.И.", "Директор", 2001)
+        assert staff.get("Неизвестный Н.Н.") is None
+
+    def test_remove(self) -> None:
+        """Проверка удаления работника"""
+        staff = make_staff()
+        assert staff.remove("Петров П.П.") is True
+        assert staff.remove("Петров П.П.") is False
+        assert staff.get("Петров П.П.") is None
+        assert [worker.name for worker in staff.workers] == [
+            "Иванов И.И.",
+            "Сидоров С.С.",
+        ]
+
+    def test_upsert(self) -> None:
+        """Проверка вставки и замены работника"""
+        staff = make_staff()
+        staff.upsert("Петров П.П.", "Главный инженер", 2010)
+        staff.upsert("Алексеев А.А.", "Бухгалтер", 2015)
+
+        assert len(staff.workers) == 4
+        assert staff.workers[0].name == "Алексеев А.А."
+        assert staff.get("Петров П.П.") == Worker(
+            "Петров П.П.", "Главный инженер", 2010
+        )
+        assert Worker("Петров П.П.", "Инженер", 2010) not in staff.workers
+
+    def test_load_drops_duplicates(self, tmp_path) -> None:
+        """Проверка удаления дубликатов при загрузке"""
+        filename = str(tmp_path / "staff.xml")
+        staff = make_staff()
+        staff.workers = [*staff.workers, *staff.workers]
+        staff.save(filename)
+
+        loaded = Staff()
+        loaded.load(filename)
+        assert loaded.workers == make_staff().workers
+        assert loaded.get("Сидоров С.С.") is not None
+
+    def test_remove_forces_rewrite(self, tmp_path) -> None:
+        """Проверка полной перезаписи файла после удаления"""
+        filename = str(tmp_path / "staff.xml")
+        staff = make_staff()
+        staff.save(filename)
+        staff.remove("Иванов И.И.")
+        staff.save(filename)
+
+        assert not (tmp_path / "staff.xml.journal").exists()
+        loaded = Staff()
+        loaded.load(filename)
+        assert loaded.workers == staff.workers
+
+    def test_assign_workers_forces_rewrite(self, tmp_path) -> None:
+        """Проверка полной перезаписи файла после замены списка работников"""
+        filename = str(tmp_path / "staff.xml")
+        make_staff().save(filename)
+
+        staff = Staff()
+        staff.load(filename)
+        staff.workers = [Worker("Z", "q", 1990)]
+        staff.save(filename)
+
+        assert not (tmp_path / "staff.xml.journal").exists()
+        loaded = Staff()
+        loaded.load(filename)
+        assert loaded.workers == [Worker("Z", "q", 1990)]
+
+    def test_workers_read_only(self) -> None:
+        """Проверка, что workers нельзя изменить в обход индекса"""
+        staff = Staff(workers=[Worker("Б", "q", 2000), Worker("А", "q", 2001)])
+
+        assert staff.workers == [Worker("А", "q", 2001), Worker("Б", "q", 2000)]
+        assert not hasattr(staff.workers, "append")
+        with pytest.raises(TypeError):
+            staff.workers[0] = Worker("В", "q", 2002)
+        assert staff.get("А") == Worker("А", "q", 2001)
+        assert staff == Staff(workers=list(reversed(staff.workers)))
+
+    def test_duplicate_names(self) -> None:
+        """Проверка работников с одинаковыми ФИО"""
+        staff = make_staff()
+        assert len(staff.workers) == 3
+        staff.add("Петров П.П.", "Директор", 2015)
+
+        assert [w.year for w in staff.workers if w.name == "Петров П.П."] == [
+            2010,
+            2015,
+        ]
+        assert staff.get("Петров П.П.").year == 2015
+        staff.upsert("Петров П.П.", "Аналитик", 2020)
+        assert [w for w in staff.workers if w.name == "Петров П.П."] == [
+            Worker("Петров П.П.", "Аналитик", 2020)
+        ]
+        assert staff.remove("Петров П.П.") is True
+        assert [w.name for w in staff.workers] == ["Иванов И.И.", "Сидоров С.С."]
+
+    def test_remove_and_upsert_defer_reordering(self) -> None:
+        """Проверка, что remove и upsert не перестраивают списки сразу"""
+        staff = make_staff()
+        ordered = staff.sorted_by("year")
+        staff.remove("Иванов И.И.")
+        staff.upsert("Сидоров С.С.", "Инженер", 1999)
+
+        assert staff._stale == {"Иванов И.И.", "Сидоров С.С."}
+        assert [w.year for w in staff.sorted_by("year")] == [1999, 2010]
+        assert [w.name for w in staff.workers] == ["Петров П.П.", "Сидоров С.С."]
+        assert not staff._stale
+        with pytest.raises(StaleViewError):
+            list(ordered)
+
+    def test_sqlite_index_operations(self) -> None:
+        """Проверка тех же операций в SqliteStaff"""
+        with SqliteStaff() as staff:
+            staff.add_many(make_staff().workers)
+            staff.upsert("Петров П.П.", "Главный инженер", 2010)
+
+            assert staff.get("Петров П.П.") == Worker(
+                "Петров П.П.", "Главный инженер", 2010
+            )
+            assert staff.remove("Иванов И.И.") is True
+            assert staff.get("Иванов И.И.") is None
+            assert len(staff) == 2
+
+
+class TestStaffSortedViews:
+    """Тесты для кэшированных упорядоченных представлений"""
+
+    def test_orders(self) -> None:
+        """Проверка упорядочивания по нескольким полям"""
+        staff = make_staff()
+
+        assert [w.name for w in staff.sorted_by("post")] == [
+            "Иванов И.И.",
+            "Петров П.П.",
+            "Сидоров С.С.",
+        ]
+        assert [w.year for w in staff.sorted_by("year")] == [2001, 2010, 2020]
+        assert [w.name for w in staff.sorted_by("post", "year")] == [
+            "Иванов И.И.",
+            "Петров П.П.",
+            "Сидоров С.С.",
+        ]
+        assert list(staff.sorted_by()) == staff.workers
+        with pytest.raises(ValueError, match="Unknown sort field"):
+            staff.sorted_by("salary")
+
+    def test_cached_and_maintained_on_add(self) -> None:
+        """Проверка повторного использования и пополнения кэша при add"""
+        staff = make_staff()
+        before = staff.sorted_by("year", "post")
+        ordered = staff._orders[("year", "post", "name")][1]
+
+        staff.add("Алексеев А.А.", "Бухгалтер", 2005)
+        staff.add("Борисов Б.Б.", "Инженер", 2010)
+
+        after = staff.sorted_by("year", "post")
+        assert staff._orders[("year", "post", "name")][1] is ordered
+        assert [w.name for w in after] == [
+            "Иванов И.И.",
+            "Алексеев А.А.",
+            "Борисов Б.Б.",
+            "Петров П.П.",
+            "Сидоров С.С.",
+        ]
+        assert list(after) == sorted(
+            staff.workers, key=lambda w: (w.year, w.post, w.name)
+        )
+        with pytest.raises(StaleViewError):
+            len(before)
+
+    @pytest.mark.parametrize("change", ["remove", "upsert", "add_many", "intern"])
+    def test_invalidated(self, change: str) -> None:
+        """Проверка сброса кэша при изменениях, которые add не покрывает"""
+        staff = make_staff()
+        staff.sorted_by("post")
+
+        if change == "remove":
+            staff.remove("Иванов И.И.")
+        elif change == "upsert":
+            staff.upsert("Петров П.П.", "Аналитик", 2010)
+        elif change == "add_many":
+            staff.add_many([Worker("Акимов А.А.", "Водитель", 1999)])
+        else:
+            staff.intern_strings()
+
+        assert list(staff.sorted_by("post")) == sorted(
+            staff.workers, key=lambda w: (w.post, w.name)
+        )
+
+    def test_select_order(self) -> None:
+        """Проверка выборки в заданном порядке"""
+        staff = make_staff()
+        staff.add("Алексеев А.А.", "Бухгалтер", 2999)
+
+        assert staff.select(0, order=["year"]) == list(staff.sorted_by("year"))[:3]
+        assert [w.name for w in staff.select(0, order=["post"])] == [
+            "Иванов И.И.",
+            "Петров П.П.",
+            "Сидоров С.С.",
+        ]
+        assert staff.select(0) == [w for w in staff.workers if w.year != 2999]
+
+    def test_report_and_sqlite(self) -> None:
+        """Проверка отчёта: Staff и SqliteStaff упорядочивают одинаково"""
+        staff = make_staff()
+        with SqliteStaff() as database:
+            database.add_many(staff.workers)
+
+            assert database.sorted_by("post", "year") == list(
+                staff.sorted_by("post", "year")
+            )
+            assert database.select(0, order=["year"]) == staff.select(0, order=["year"])
+            assert database.report("year") == staff.report("year")
+        assert staff.report() == str(staff)
+
+    def test_batch_list_order(self) -> None:
+        """Проверка команды list с полями упорядочивания"""
+        staff = make_staff()
+        out = io.StringIO()
+        run_batch(staff, io.StringIO("list year\nselect 0 year\n"), out)
+
+        assert staff.report("year") in out.getvalue()
+        assert out.getvalue().endswith(
+            "   1: Иванов И.И.\n   2: Петров П.П.\n   3: Сидоров С.С.\n"
+        )
+
+
+class TestBatchMode:
+    """Тесты для пакетного режима командной строки"""
+
+    def test_batch_adds_and_save(self, tmp_path) -> None:
+        """Проверка пакетного добавления и сохранения"""
+        filename = str(tmp_path / "staff.xml")
+        script = io.StringIO(
+            "add\nПетров П.П.\nИнженер\n2010\n"
+            "add\nИванов И.И.\nДиректор\n2001\n"
+            "add\nСидоров С.С.\nИнженер\n2020\n"
+            f"\nsave {filename}\nselect 100\nlist\n"
+        )
+        out = io.StringIO()
+        staff = Staff()
+        run_batch(staff, script, out)
+
+        assert staff.workers == make_staff().workers
+        assert out.getvalue().startswith("Работники с заданным стажем не найдены.\n")
+        assert str(staff) in out.getvalue()
+
+        loaded = Staff()
+        loaded.load(filename)
+        assert loaded.workers == staff.workers
+
+    def test_batch_exit_stops(self) -> None:
+        """Проверка остановки по команде exit"""
+        out = io.StringIO()
+        staff = Staff()
+        run_batch(staff, io.StringIO("exit\nadd\nA\nB\n2000\n"), out)
+
+        assert staff.workers == []
+        assert out.getvalue() == ""
+
+    def test_add_many(self, tmp_path) -> None:
+        """Проверка пакетного добавления с журналом"""
+        filename = str(tmp_path / "staff.xml")
+        staff = Staff()
+        staff.save(filename)
+        staff.add_many(make_staff().workers)
+        staff.save(filename)
+
+        assert staff.get("Иванов И.И.") is not None
+        assert (tmp_path / "staff.xml.journal").exists()
+        loaded = Staff()
+        loaded.load(filename)
+        assert loaded.workers == make_staff().workers
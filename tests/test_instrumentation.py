@@ -0,0 +1,110 @@
+import os
+import sys
+from typing import List, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "examples"))
+from examples2 import Staff  # noqa: E402
+from task_package import instrumentation  # noqa: E402
+from task_package.instrumentation import Histogram, Instrumentation  # noqa: E402
+from task_package.zad1 import MusicCatalog, Track  # noqa: E402
+from task_package.zad2 import RingBuffer  # noqa: E402
+
+
+class TestInstrumentation:
+    """Тесты для счётчиков и гистограмм"""
+
+    def test_counters_and_sink(self) -> None:
+        """Проверка счётчиков и передачи событий в приёмник"""
+        events: List[Tuple[str, float]] = []
+        metrics = Instrumentation(sink=lambda name, value: events.append((name, value)))
+
+        metrics.incr("a")
+        metrics.incr("a", 4)
+        metrics.observe("t", 0.5)
+
+        assert metrics.snapshot()["counters"] == {"a": 5}
+        assert events == [("a", 1), ("a", 4), ("t", 0.5)]
+
+    def test_histogram(self) -> None:
+        """Проверка гистограммы длительностей"""
+        histogram = Histogram()
+        histogram.observe(0.000003)
+        histogram.observe(0.001)
+
+        snapshot = histogram.snapshot()
+        assert snapshot["count"] == 2
+        assert snapshot["max"] == 0.001
+        assert snapshot["buckets_us"] == {4: 1, 1024: 1}
+
+    def test_timer_and_reset(self) -> None:
+        """Проверка измерения блока кода и сброса"""
+        metrics = Instrumentation()
+        with metrics.timer("block"):
+            pass
+
+        assert metrics.snapshot()["timings"]["block"]["count"] == 1
+        metrics.reset()
+        assert metrics.snapshot() == {"counters": {}, "timings": {}}
+
+    def test_global_enable(self) -> None:
+        """Проверка включения сбора метрик для новых объектов"""
+        assert RingBuffer[int]().metrics is None
+        metrics = instrumentation.enable()
+        try:
+            assert RingBuffer[int]().metrics is metrics
+            assert MusicCatalog().metrics is metrics
+        finally:
+            instrumentation.disable()
+        assert MusicCatalog().stats() == {}
+
+
+class TestClassStats:
+    """Тесты для метрик классов пакета"""
+
+    def test_ring_buffer_stats(self) -> None:
+        """Проверка счётчиков кольцевого буфера"""
+        buffer: RingBuffer[int] = RingBuffer[int](capacity=2, metrics=Instrumentation())
+        for i in range(5):
+            buffer.push(i)
+        buffer.pop()
+        buffer.clear()
+        buffer.pop()
+
+        assert buffer.stats()["counters"] == {
+            "ring_buffer.push": 5,
+            "ring_buffer.overwrite": 3,
+            "ring_buffer.pop": 1,
+            "ring_buffer.clear": 1,
+            "ring_buffer.discard": 1,
+            "ring_buffer.pop_empty": 1,
+        }
+
+    def test_music_catalog_stats(self) -> None:
+        """Проверка метрик каталога"""
+        catalog = MusicCatalog(metrics=Instrumentation())
+        catalog.add_track(Track("Song", "Artist", 100))
+        catalog.get_tracks_by_artist("artist")
+        catalog.get_tracks_by_artist("artist")
+        catalog.get_tracks_shorter_than(1)
+
+        stats = catalog.stats()
+        assert stats["counters"] == {"music_catalog.add_track": 1}
+        assert stats["timings"]["music_catalog.get_tracks_by_artist"]["count"] == 2
+        assert stats["timings"]["music_catalog.get_tracks_shorter_than"]["count"] == 1
+
+    def test_staff_stats(self, tmp_path) -> None:
+        """Проверка метрик загрузки штата"""
+        filename = str(tmp_path / "staff.xml")
+        staff = Staff(metrics=Instrumentation())
+        staff.add("Иванов И.И.", "Директор", 2001)
+        staff.save(filename)
+        staff.load(filename)
+        staff.select(1)
+
+        stats = staff.stats()
+        assert stats["counters"]["staff.add"] == 1
+        assert stats["counters"]["staff.load.workers"] == 1
+        assert stats["timings"]["staff.load.parse"]["count"] == 1
+        assert stats["timings"]["staff.load.build"]["count"] == 1
+        assert stats["timings"]["staff.select"]["count"] == 1
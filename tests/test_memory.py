@@ -0,0 +1,93 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "examples"))
+from examples2 import Staff, Worker  # noqa: E402
+from task_package.memory import sizeof  # noqa: E402
+from task_package.zad1 import MusicCatalog, Track  # noqa: E402
+from task_package.zad2 import RingBuffer  # noqa: E402
+
+
+def unique(value: str) -> str:
+    """Равная, но отдельная копия строки"""
+    return "".join(list(value))
+
+
+class TestSizeof:
+    """Тесты для функции sizeof"""
+
+    def test_shared_objects_counted_once(self) -> None:
+        """Проверка, что повторные ссылки не удваивают размер"""
+        text = "x" * 1000
+        single = sizeof([text])
+        assert sizeof([text, text]) == single + 8
+        assert sizeof([text, unique(text)]) > single + sys.getsizeof(text)
+
+    def test_shallow_and_exclude(self) -> None:
+        """Проверка режима deep=False и исключения атрибутов"""
+        catalog = MusicCatalog(tracks=[Track("T" * 500, "A", 1) for _ in range(10)])
+
+        shallow = catalog.memory_usage(deep=False)
+        deep = catalog.memory_usage()
+        assert sys.getsizeof(catalog.tracks) < shallow < deep
+        assert sizeof(catalog, exclude=("tracks",)) < deep - 500
+
+
+class TestInternStrings:
+    """Тесты для замены повторяющихся строк общими копиями"""
+
+    def test_catalog(self) -> None:
+        """Проверка каталога: исполнители хранятся в одном экземпляре"""
+        artist = "Artist " + "x" * 200
+        tracks = [Track(f"T{i}", unique(artist), i) for i in range(50)]
+        catalog = MusicCatalog(tracks=tracks)
+        before = catalog.memory_usage()
+
+        assert catalog.intern_strings() == 49
+        assert len({id(track.artist) for track in catalog.tracks}) == 1
+        assert catalog.memory_usage() < before - 48 * len(artist)
+        stats = catalog.artist_stats(artist)
+        assert stats is not None and stats.count == 50
+        assert catalog.intern_strings() == 0
+
+    def test_staff(self) -> None:
+        """Проверка работников: должности пересоздаются с общей строкой"""
+        post = "Инженер " + "x" * 200
+        staff = Staff()
+        staff.add_many(Worker(f"Работник {i}", unique(post), 2000) for i in range(20))
+        before = staff.memory_usage()
+
+        assert staff.intern_strings() == 19
+        assert len({id(worker.post) for worker in staff.workers}) == 1
+        assert staff.get("Работник 5") in staff.workers
+        assert staff.get("Работник 5").post is staff.workers[0].post
+        assert staff.memory_usage() < before
+
+    def test_ring_buffer(self) -> None:
+        """Проверка буфера: порядок элементов сохраняется"""
+        buffer: RingBuffer[object] = RingBuffer[object](capacity=4)
+        for item in ["ab" * 50, 1, unique("ab" * 50), None, unique("ab" * 50)]:
+            buffer.push(item)
+        before = buffer.memory_usage()
+
+        assert buffer.intern_strings() == 1
+        assert buffer.get_all() == [1, "ab" * 50, None, "ab" * 50]
+        assert buffer.get_all()[1] is buffer.get_all()[3]
+        assert buffer.memory_usage() < before
+
+    def test_ring_buffer_skips_sinks(self) -> None:
+        """Проверка, что обработчики вытеснения не считаются памятью буфера"""
+
+        class Writer:
+            def __init__(self) -> None:
+                self.data = bytearray(1_000_000)
+
+            def __call__(self, value: object) -> None:
+                self.data.append(len(value) if isinstance(value, list) else 1)
+
+        plain: RingBuffer[str] = RingBuffer[str](capacity=4)
+        with_sink: RingBuffer[str] = RingBuffer[str](
+            capacity=4, spill_sink=Writer(), on_evict=Writer()
+        )
+        assert with_sink.memory_usage() == plain.memory_usage()
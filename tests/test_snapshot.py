@@ -0,0 +1,83 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+from task_package.snapshot import SnapshotView, write_snapshot  # noqa: E402
+from task_package.zad1 import MusicCatalog, Track  # noqa: E402
+
+
+class TestSnapshot:
+    """Тесты для бинарного формата снимков"""
+
+    def test_roundtrip_records(self, tmp_path) -> None:
+        """Проверка записи и чтения произвольных записей"""
+        filename = str(tmp_path / "records.bin")
+        records = [("Иванов И.И.", 1999), ("", -5), ("Smith", 2**40)]
+        write_snapshot(filename, b"TEST", "si", records)
+
+        with SnapshotView(filename, b"TEST", "si", lambda *r: r) as view:
+            assert len(view) == 3
+            assert view[0] == ("Иванов И.И.", 1999)
+            assert view[-1] == ("Smith", 2**40)
+            assert view[1:] == records[1:]
+            assert list(view) == records
+
+    def test_empty_snapshot(self, tmp_path) -> None:
+        """Проверка пустого снимка"""
+        filename = str(tmp_path / "empty.bin")
+        write_snapshot(filename, b"TEST", "s", [])
+
+        with SnapshotView(filename, b"TEST", "s", str) as view:
+            assert len(view) == 0
+            assert list(view) == []
+
+    def test_index_out_of_range(self, tmp_path) -> None:
+        """Проверка обращения за границы снимка"""
+        filename = str(tmp_path / "one.bin")
+        write_snapshot(filename, b"TEST", "i", [(1,)])
+
+        with SnapshotView(filename, b"TEST", "i", int) as view:
+            with pytest.raises(IndexError):
+                view[1]
+
+    def test_wrong_magic_and_schema(self, tmp_path) -> None:
+        """Проверка отказа при несовпадении формата"""
+        filename = str(tmp_path / "data.bin")
+        write_snapshot(filename, b"TEST", "si", [("a", 1)])
+
+        with pytest.raises(ValueError, match="magic"):
+            SnapshotView(filename, b"XXXX", "si", tuple)
+        with pytest.raises(ValueError, match="schema"):
+            SnapshotView(filename, b"TEST", "is", tuple)
+
+    def test_truncated_snapshot(self, tmp_path) -> None:
+        """Проверка отказа для обрезанного и пустого файла"""
+        filename = tmp_path / "data.bin"
+        write_snapshot(str(filename), b"TEST", "si", [("abc", 1), ("de", 2)])
+        data = filename.read_bytes()
+
+        for size in (0, 10, 30, len(data) - 1):
+            filename.write_bytes(data[:size])
+            with pytest.raises(ValueError, match="truncated snapshot"):
+                SnapshotView(str(filename), b"TEST", "si", tuple)
+
+    def test_invalid_schema(self, tmp_path) -> None:
+        """Проверка некорректной схемы записи"""
+        with pytest.raises(ValueError, match="Invalid snapshot schema"):
+            write_snapshot(str(tmp_path / "bad.bin"), b"TEST", "sf", [])
+
+
+def test_music_catalog_snapshot(tmp_path) -> None:
+    """Проверка сохранения и загрузки каталога через снимок"""
+    filename = str(tmp_path / "catalog.bin")
+    catalog = MusicCatalog()
+    catalog.add_track(Track("Bohemian Rhapsody", "Queen", 354))
+    catalog.add_track(Track("Кино", "Группа крови", 282))
+    catalog.save_snapshot(filename)
+
+    assert MusicCatalog.load_snapshot(filename) == catalog
+
+    with MusicCatalog.open_snapshot(filename) as snapshot:
+        assert snapshot[1] == Track("Кино", "Группа крови", 282)
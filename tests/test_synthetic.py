@@ -0,0 +1,55 @@
+import os
+import sys
+from collections import Counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "examples"))
+from examples2 import Staff  # noqa: E402
+from task_package.synthetic import (  # noqa: E402
+    generate_positions,
+    generate_tracks,
+    generate_workers,
+    percentiles,
+    write_workers_xml,
+)
+
+
+class TestGenerators:
+    """Тесты для генераторов синтетических данных"""
+
+    def test_deterministic_by_seed(self) -> None:
+        """Проверка воспроизводимости при одинаковом зерне"""
+        assert list(generate_tracks(50, seed=1)) == list(generate_tracks(50, seed=1))
+        assert list(generate_workers(50, seed=1)) == list(generate_workers(50, seed=1))
+        assert list(generate_positions(50, seed=1)) != list(
+            generate_positions(50, seed=2)
+        )
+
+    def test_tracks_zipf_distribution(self) -> None:
+        """Проверка, что популярные исполнители встречаются чаще"""
+        counts = Counter(track.artist for track in generate_tracks(5000, artists=100))
+        assert counts["Artist 0"] > counts["Artist 10"] > counts.get("Artist 90", 0)
+
+    def test_positions_in_range(self) -> None:
+        """Проверка диапазона координат"""
+        for _, lon, lat in generate_positions(1000):
+            assert -180 <= lon <= 180
+            assert -90 <= lat <= 90
+
+    def test_workers_xml_loads(self, tmp_path) -> None:
+        """Проверка загрузки сгенерированного XML в Staff"""
+        filename = str(tmp_path / "staff.xml")
+        records = list(generate_workers(200, seed=3))
+        write_workers_xml(filename, records)
+
+        staff = Staff()
+        staff.load(filename)
+        assert len(staff.workers) == 200
+        assert {worker.name for worker in staff.workers} == {r[0] for r in records}
+
+
+def test_percentiles() -> None:
+    """Проверка расчёта перцентилей"""
+    samples = [float(i) for i in range(1, 101)]
+    assert percentiles(samples, (50, 99, 100)) == [(50, 50.0), (99, 99.0), (100, 100.0)]
+    assert percentiles([], (50,)) == [(50, 0.0)]
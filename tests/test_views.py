@@ -0,0 +1,132 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+from task_package.views import SequenceView, StaleViewError  # noqa: E402
+from task_package.zad1 import MusicCatalog, Track  # noqa: E402
+from task_package.zad2 import RingBuffer  # noqa: E402
+
+
+def make_buffer(count: int, capacity: int = 5) -> RingBuffer[int]:
+    buffer: RingBuffer[int] = RingBuffer[int](capacity=capacity)
+    for i in range(count):
+        buffer.push(i)
+    return buffer
+
+
+class TestSequenceView:
+    """Тесты для представления SequenceView"""
+
+    def test_indexing_and_slicing(self) -> None:
+        """Проверка индексов и срезов без копирования"""
+        data = list(range(10))
+        view = SequenceView(data, lambda: 0)
+
+        assert len(view) == 10
+        assert view[0] == 0 and view[-1] == 9
+        assert list(view[2:5]) == [2, 3, 4]
+        assert list(view[::3]) == [0, 3, 6, 9]
+        assert list(view[::-2]) == [9, 7, 5, 3, 1]
+        assert list(view[1:8][2:4]) == [3, 4]
+        assert isinstance(view[2:5], SequenceView)
+        with pytest.raises(IndexError):
+            view[10]
+
+    def test_sequence_protocol(self) -> None:
+        """Проверка методов, унаследованных от Sequence"""
+        view = SequenceView(["a", "b", "c", "b"], lambda: 0)
+
+        assert "c" in view
+        assert view.index("b") == 1
+        assert view.count("b") == 2
+        assert list(reversed(view)) == ["b", "c", "b", "a"]
+        assert view.to_list() == ["a", "b", "c", "b"]
+        assert repr(view) == "SequenceView(['a', 'b', 'c', 'b'])"
+        assert view == ["a", "b", "c", "b"] and ["a", "b", "c", "b"] == view
+        assert view[1:] == SequenceView(["b", "c", "b"], lambda: 0)
+        assert view != ("a", "b", "c", "b") and view != ["a"]
+
+
+class TestRingBufferView:
+    """Тесты для представлений кольцевого буфера"""
+
+    def test_view_after_wraparound(self) -> None:
+        """Проверка порядка элементов после переполнения"""
+        buffer = make_buffer(8)
+        view = buffer.view()
+
+        assert list(view) == [3, 4, 5, 6, 7]
+        assert view[0] == buffer.peek()
+        assert list(view[1:3]) == [4, 5]
+        assert list(buffer) == buffer.get_all()
+
+    @pytest.mark.parametrize("action", ["push", "pop", "clear"])
+    def test_stale_after_modification(self, action: str) -> None:
+        """Проверка, что изменение буфера делает представление недействительным"""
+        buffer = make_buffer(3)
+        view = buffer.view()
+        part = view[1:]
+
+        if action == "push":
+            buffer.push(10)
+        else:
+            getattr(buffer, action)()
+
+        for stale in (view, part):
+            with pytest.raises(StaleViewError):
+                len(stale)
+            with pytest.raises(StaleViewError):
+                stale[0]
+            with pytest.raises(StaleViewError):
+                list(stale)
+
+    def test_pop_on_empty_keeps_view(self) -> None:
+        """Проверка, что pop из пустого буфера не меняет версию"""
+        buffer = make_buffer(0)
+        view = buffer.view()
+        assert buffer.pop() is None
+        assert len(view) == 0
+
+    def test_mutation_during_iteration(self) -> None:
+        """Проверка изменения буфера во время обхода"""
+        buffer = make_buffer(5)
+        with pytest.raises(StaleViewError):
+            for item in buffer:
+                buffer.push(item)
+
+    def test_str_unchanged(self) -> None:
+        """Проверка строкового представления без копирования в список"""
+        buffer: RingBuffer[str] = RingBuffer[str](capacity=3)
+        assert str(buffer) == "RingBuffer(capacity=3, size=0, items=[])"
+        buffer.push("a")
+        buffer.push("b")
+        assert str(buffer) == "RingBuffer(capacity=3, size=2, items=['a', 'b'])"
+
+
+class TestCatalogView:
+    """Тесты для представления треков каталога"""
+
+    def test_tracks_view(self) -> None:
+        """Проверка доступа к трекам без копирования"""
+        tracks = [Track(f"T{i}", "A", i) for i in range(4)]
+        catalog = MusicCatalog(tracks=list(tracks))
+        view = catalog.tracks_view()
+
+        assert list(view) == tracks
+        assert view[-1] is catalog.tracks[-1]
+        assert list(view[:2]) == tracks[:2]
+
+    def test_stale_after_add(self) -> None:
+        """Проверка устаревания после add_track и прямого изменения списка"""
+        catalog = MusicCatalog()
+        view = catalog.tracks_view()
+        catalog.add_track(Track("T", "A", 1))
+        with pytest.raises(StaleViewError):
+            list(view)
+
+        view = catalog.tracks_view()
+        catalog.tracks.append(Track("U", "B", 2))
+        with pytest.raises(StaleViewError):
+            view[0]
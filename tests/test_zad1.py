@@ -1,10 +1,18 @@
 import os
 import sys
+from typing import List
 
 import pytest
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
-from task_package.zad1 import MusicCatalog, Track  # noqa: E402
+from task_package import zad1  # noqa: E402
+from task_package.zad1 import (  # noqa: E402
+    ArtistStats,
+    MusicCatalog,
+    ShardedMusicCatalog,
+    Track,
+    shorter_than_query,
+)
 
 
 class TestTrack:
@@ -147,3 +155,139 @@ class TestMusicCatalog:
         # Проверяем, что каталог не изменился
         assert len(sample_catalog.tracks) == original_count
         assert sample_catalog.tracks == original_tracks
+
+
+class TestShardedMusicCatalog:
+    """Тесты для шардированного каталога"""
+
+    @staticmethod
+    def make_tracks() -> List[Track]:
+        """Треки нескольких исполнителей вперемешку"""
+        return [
+            Track(f"Song {i}", f"Artist {i % 7}", 30 * (i % 12)) for i in range(60)
+        ]
+
+    @pytest.mark.parametrize("max_workers", [0, 2])
+    def test_queries_match_catalog(self, max_workers: int) -> None:
+        """Проверка совпадения результатов с обычным каталогом"""
+        catalog = MusicCatalog()
+        with ShardedMusicCatalog(shard_count=3, max_workers=max_workers) as sharded:
+            for track in self.make_tracks():
+                catalog.add_track(track)
+                sharded.add_track(track)
+
+            assert len(sharded) == 60
+            assert sharded.tracks == catalog.tracks
+            for minutes in (0, 1, 3, 10):
+                expected = catalog.get_tracks_shorter_than(minutes)
+                assert sharded.get_tracks_shorter_than(minutes) == expected
+
+            expected = catalog.get_tracks_by_artist("ARTIST 3")
+            assert sharded.get_tracks_by_artist("artist 3") == expected
+
+    def test_add_after_query_refreshes_workers(self) -> None:
+        """Проверка, что добавление после запроса учитывается процессами"""
+        with ShardedMusicCatalog(shard_count=2, max_workers=1) as sharded:
+            sharded.add_track(Track("A", "X", 10))
+            assert len(sharded.get_tracks_shorter_than(1)) == 1
+            sharded.add_track(Track("B", "Y", 20))
+            assert [t.title for t in sharded.get_tracks_shorter_than(1)] == ["A", "B"]
+
+    def test_add_keeps_pool(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Проверка, что добавление не перезапускает пул до порога REBASE_ROWS"""
+        monkeypatch.setattr(zad1, "REBASE_ROWS", 5)
+        with ShardedMusicCatalog(shard_count=2, max_workers=1) as sharded:
+            sharded.add_track(Track("A", "X", 10))
+            sharded.get_tracks_shorter_than(1)
+            pool = sharded._executor
+
+            for i in range(3):
+                sharded.add_track(Track(f"B{i}", "Y", 20))
+                assert len(sharded.get_tracks_shorter_than(1)) == i + 2
+            assert sharded._executor is pool
+
+            for i in range(10):
+                sharded.add_track(Track(f"C{i}", "X", 30))
+            assert len(sharded.get_tracks_shorter_than(1)) == 14
+            assert sharded._executor is not pool
+
+    def test_custom_shard_query(self) -> None:
+        """Проверка запроса пользователя: результат - номера треков"""
+        with ShardedMusicCatalog(shard_count=3, max_workers=0) as sharded:
+            for track in self.make_tracks():
+                sharded.add_track(track)
+
+            found = sharded.map_shards(shorter_than_query, 60)
+            assert sorted(n for shard in found for n in shard) == [
+                i for i, track in enumerate(sharded.tracks) if track.duration_sec < 60
+            ]
+
+    def test_invalid_shard_count(self) -> None:
+        """Проверка некорректного числа шардов"""
+        with pytest.raises(ValueError, match="Shard count must be positive"):
+            ShardedMusicCatalog(shard_count=0)
+
+
+class TestCatalogAggregates:
+    """Тесты для статистики каталога"""
+
+    def test_artist_stats(self) -> None:
+        """Проверка статистики исполнителя"""
+        catalog = MusicCatalog([Track("A", "Queen", 300)])
+        catalog.add_track(Track("B", "queen", 100))
+        catalog.add_track(Track("C", "Queen", 200))
+        catalog.add_track(Track("D", "Nirvana", 250))
+
+        stats = catalog.artist_stats("QUEEN")
+        assert stats == ArtistStats(
+            "Queen", count=3, total_sec=600, min_sec=100, max_sec=300
+        )
+        assert catalog.artist_stats("Unknown") is None
+        assert [s.artist for s in catalog.all_artist_stats()] == ["Queen", "Nirvana"]
+        assert catalog.total_duration_sec == 850
+
+    def test_stats_are_copies(self) -> None:
+        """Проверка, что изменение результата не портит каталог"""
+        catalog = MusicCatalog([Track("A", "Queen", 300)])
+        stats = catalog.artist_stats("Queen")
+        assert stats is not None
+        stats.count = 100
+        assert catalog.artist_stats("Queen") == ArtistStats("Queen", 1, 300, 300, 300)
+
+    def test_duration_histogram(self) -> None:
+        """Проверка гистограммы длительностей"""
+        catalog = MusicCatalog(histogram_bucket_sec=120)
+        for duration in (10, 119, 120, 250, 600):
+            catalog.add_track(Track("T", "A", duration))
+
+        assert catalog.duration_histogram() == {0: 2, 120: 1, 240: 1, 600: 1}
+
+    def test_matches_full_scan(self) -> None:
+        """Проверка совпадения со статистикой полным проходом"""
+        catalog = MusicCatalog()
+        for i in range(100):
+            catalog.add_track(Track(f"T{i}", f"Artist {i % 9}", (i * 37) % 500))
+
+        for artist in {track.artist for track in catalog.tracks}:
+            durations = [t.duration_sec for t in catalog.get_tracks_by_artist(artist)]
+            stats = catalog.artist_stats(artist)
+            assert stats is not None
+            assert (stats.count, stats.total_sec) == (len(durations), sum(durations))
+            assert (stats.min_sec, stats.max_sec) == (min(durations), max(durations))
+
+    def test_sharded_aggregates(self) -> None:
+        """Проверка статистики шардированного каталога"""
+        catalog = MusicCatalog()
+        with ShardedMusicCatalog(shard_count=3, max_workers=0) as sharded:
+            for i in range(50):
+                track = Track(f"T{i}", f"Artist {i % 5}", i * 13)
+                catalog.add_track(track)
+                sharded.add_track(track)
+
+            assert sharded.duration_histogram() == catalog.duration_histogram()
+            assert sharded.artist_stats("artist 2") == catalog.artist_stats("Artist 2")
+
+    def test_invalid_bucket(self) -> None:
+        """Проверка некорректной ширины корзины"""
+        with pytest.raises(ValueError, match="Histogram bucket must be positive"):
+            MusicCatalog(histogram_bucket_sec=0)
@@ -329,6 +329,97 @@ class TestRingBufferEdgeCases:
         assert buffer.is_full() is False
 
 
+class TestRingBufferEviction:
+    """Тесты для обработки вытесненных элементов"""
+
+    def test_on_evict_callback(self) -> None:
+        """Проверка вызова обработчика для каждого вытесненного элемента"""
+        evicted: List[int] = []
+        buffer: RingBuffer[int] = RingBuffer[int](capacity=3, on_evict=evicted.append)
+
+        for i in range(7):
+            buffer.push(i)
+
+        assert evicted == [0, 1, 2, 3]
+        assert buffer.get_all() == [4, 5, 6]
+
+    def test_spill_sink_batches(self) -> None:
+        """Проверка пакетной выгрузки вытесненных элементов"""
+        batches: List[List[int]] = []
+        buffer: RingBuffer[int] = RingBuffer[int](
+            capacity=2, spill_sink=batches.append, spill_batch_size=3
+        )
+
+        for i in range(9):
+            buffer.push(i)
+
+        assert batches == [[0, 1, 2], [3, 4, 5]]
+        assert buffer.flush() == 1
+        assert batches[-1] == [6]
+        assert buffer.flush() == 0
+
+    def test_drain_to(self) -> None:
+        """Проверка извлечения всех элементов пачками"""
+        buffer: RingBuffer[int] = RingBuffer[int](capacity=5)
+        for i in range(7):
+            buffer.push(i)
+
+        batches: List[List[int]] = []
+        assert buffer.drain_to(batches.append, batch_size=2) == 5
+        assert batches == [[2, 3], [4, 5], [6]]
+        assert buffer.is_empty() is True
+        assert buffer.drain_to(batches.append) == 0
+
+    def test_drain_flushes_spill_first(self) -> None:
+        """Проверка порядка: сначала вытесненные, затем оставшиеся элементы"""
+        written: List[int] = []
+        buffer: RingBuffer[int] = RingBuffer[int](
+            capacity=2, spill_sink=written.extend, spill_batch_size=10
+        )
+        for i in range(5):
+            buffer.push(i)
+
+        buffer.drain_to(written.extend)
+        assert written == [0, 1, 2, 3, 4]
+
+    def test_drain_sink_failure_keeps_items(self) -> None:
+        """Проверка, что при ошибке sink непереданные элементы остаются в буфере"""
+        buffer: RingBuffer[int] = RingBuffer[int](capacity=5)
+        for i in range(5):
+            buffer.push(i)
+        batches: List[List[int]] = []
+
+        def sink(batch: List[int]) -> None:
+            if batches:
+                raise OSError("disk full")
+            batches.append(batch)
+
+        with pytest.raises(OSError):
+            buffer.drain_to(sink, batch_size=2)
+        assert batches == [[0, 1]]
+        assert buffer.get_all() == [2, 3, 4]
+        assert len(buffer) == 3
+
+    def test_clear_bypasses_eviction(self) -> None:
+        """Проверка, что clear не передаёт элементы обработчикам вытеснения"""
+        evicted: List[int] = []
+        buffer: RingBuffer[int] = RingBuffer[int](
+            capacity=2, on_evict=evicted.append, spill_sink=evicted.extend
+        )
+        buffer.push(1)
+        buffer.push(2)
+        buffer.clear()
+        assert buffer.flush() == 0
+        assert evicted == []
+
+    def test_invalid_batch_size(self) -> None:
+        """Проверка некорректного размера пачки"""
+        with pytest.raises(ValueError, match="Batch size must be positive"):
+            RingBuffer[int](spill_batch_size=0)
+        with pytest.raises(ValueError, match="Batch size must be positive"):
+            RingBuffer[int]().drain_to(print, batch_size=0)
+
+
 # Интеграционные тесты
 def test_integration_scenario() -> None:
     """Интеграционный тест полного сценария использования"""